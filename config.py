@@ -1,9 +1,17 @@
+import atexit
 import json
 import os
 import threading
 import time
 from typing import Dict, Any
 
+# orjson is optional - fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ===== CONFIGURATION CONSTANTS =====
 
 DEFAULT_CONFIG = {
@@ -36,6 +44,12 @@ SUPPORTED_FORMATS = {
     'yaml': 'YAML file (.yaml)'
 }
 
+# Seconds to wait after a change before the background saver writes to disk
+SAVE_INTERVAL = 1.0
+
+# Sentinel for missing keys in Config.get (distinct from any stored value)
+_MISSING = object()
+
 TRACKER_PRESETS = {
     'default': [
         'udp://tracker.opentrackr.org:1337/announce',
@@ -52,19 +66,31 @@ class Config:
     
     def __init__(self, config_path: str = "tracker_manager_config.json"):
         self.config_path = config_path
+        # Resolved once - saves reuse these instead of re-deriving paths per write
+        self._abs_path = os.path.abspath(config_path)
+        self._dir = os.path.dirname(self._abs_path)
+        self._tmp_path = self._abs_path + '.tmp'
+        os.makedirs(self._dir, exist_ok=True)
+        self._get_cache: Dict[str, Any] = {}  # resolved dotted keys, cleared on set()
         self.data = self.load_config()
-        self._pending_saves = 0
-        self._save_timer = None
+        self._dirty = False
         self._save_lock = threading.Lock()
+        
+        # One long-lived saver thread coalesces every set() into a single write
+        self._wake = threading.Event()
+        self._save_thread = threading.Thread(target=self._save_loop, name="config-saver", daemon=True)
+        self._save_thread.start()
+        atexit.register(self._flush_pending_saves)
     
     # ===== CONFIGURATION LOADING AND INITIALIZATION =====
     
     def load_config(self) -> Dict[str, Any]:
         """Load config from file or create default"""
-        if os.path.exists(self.config_path):
+        if os.path.exists(self._abs_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                with open(self._abs_path, 'rb') as f:
+                    raw = f.read()
+                return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             except Exception as e:
                 print(f"Error loading config: {e}, using defaults")
         
@@ -96,11 +122,19 @@ class Config:
     
     def get(self, key: str, default=None):
         """Get config value using dot notation"""
-        keys = key.split('.')
-        value = self.data
-        for k in keys:
-            value = value.get(k, {})
-        return value if value != {} else default
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self.data
+            for k in key.split('.'):
+                if not isinstance(value, dict):
+                    value = _MISSING
+                    break
+                value = value.get(k, _MISSING)
+                if value is _MISSING:
+                    break
+            self._get_cache[key] = value
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any, immediate=False):
         """Set config value with optional batching"""
@@ -109,9 +143,12 @@ class Config:
         for k in keys[:-1]:
             config_ref = config_ref.setdefault(k, {})
         config_ref[keys[-1]] = value
+        self._get_cache.clear()
         
         if immediate:
-            self._save_config_immediate()
+            with self._save_lock:
+                self._dirty = False
+                self._save_config_immediate()
         else:
             self._schedule_save()
     
@@ -122,30 +159,24 @@ class Config:
     # ===== BATCHED SAVE MANAGEMENT =====
     
     def _schedule_save(self):
-        """Schedule a batched save"""
-        with self._save_lock:
-            self._pending_saves += 1
-            
-            # Cancel existing timer
-            if self._save_timer:
-                self._save_timer.cancel()
-            
-            # Save immediately if too many pending, or schedule delayed save
-            if self._pending_saves >= 10:
-                self._save_config_immediate()
-                self._pending_saves = 0
-            else:
-                self._save_timer = threading.Timer(1.0, self._flush_pending_saves)
-                self._save_timer.daemon = True
-                self._save_timer.start()
+        """Mark config dirty and wake the background saver"""
+        self._dirty = True
+        self._wake.set()
+    
+    def _save_loop(self):
+        """Background saver - writes at most once per SAVE_INTERVAL"""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            time.sleep(SAVE_INTERVAL)
+            self._flush_pending_saves()
     
     def _flush_pending_saves(self):
         """Flush pending saves to disk"""
         with self._save_lock:
-            if self._pending_saves > 0:
+            if self._dirty:
+                self._dirty = False
                 self._save_config_immediate()
-                self._pending_saves = 0
-                self._save_timer = None
     
     # ===== FILE OPERATIONS =====
     
@@ -153,11 +184,36 @@ class Config:
         """Save config to file immediately"""
         data = config_data or self.data
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(self.config_path)), exist_ok=True)
+            # Serialize once and hand the bytes to a single write call
+            if ORJSON_AVAILABLE:
+                data_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            else:
+                data_bytes = (json.dumps(data, indent=2) + '\n').encode('utf-8')
             
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file and atomically swap it in so a crash
+            # mid-write never leaves a truncated config behind
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            # Keep the permissions of the config being replaced (e.g. a user's 0600)
+            try:
+                mode = os.stat(self._abs_path).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = None
+            try:
+                fd = os.open(self._tmp_path, flags, 0o644)
+            except FileNotFoundError:
+                # Directory removed since startup - recreate it once
+                os.makedirs(self._dir, exist_ok=True)
+                fd = os.open(self._tmp_path, flags, 0o644)
+            try:
+                view = memoryview(data_bytes)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if mode is not None:
+                os.chmod(self._tmp_path, mode)
+            os.replace(self._tmp_path, self._abs_path)
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -168,10 +224,8 @@ class Config:
     # ===== CLEANUP AND DESTRUCTION =====
     
     def __del__(self):
-        """Cleanup timer on destruction"""
+        """Flush pending changes on destruction"""
         try:
             self._flush_pending_saves()
-            if self._save_timer:
-                self._save_timer.cancel()
         except:
             pass  # Ignore errors during cleanup
\ No newline at end of file
@@ -4,6 +4,8 @@ import logging
 from typing import Callable, Any, Tuple, List, Dict
 import csv  
 import io
+import json
+import math
 
 from models import TrackerDatabase, Tracker, TrackerCollection, TrackerStats
 from config import Config
@@ -99,9 +101,9 @@ class MainController:
     
     # ===== NETWORK INTERFACE METHODS =====
     
-    def get_network_interfaces(self):
+    def get_network_interfaces(self, refresh=False):
         """Get available network interfaces"""
-        return self.validator.interface_binder.detect_interfaces()
+        return self.validator.interface_binder.detect_interfaces(refresh=refresh)
     
     def set_validation_interface(self, interface_name):
         """Set network interface for validation"""
@@ -114,12 +116,19 @@ class MainController:
     
     # ===== TRACKER PROCESSING METHODS =====
     
-    def find_duplicates(self, text: str) -> dict:
-        """Find and remove duplicate trackers"""
-        if not text.strip():
-            raise ValueError("Please paste some tracker URLs first!")
+    def find_duplicates(self, text) -> dict:
+        """Find and remove duplicate trackers (text is a str or an iterable of whole-line blocks)"""
+        blocks = [text] if isinstance(text, str) else text
         
-        all_trackers = self.parser.extract_trackers_from_text(text)
+        # URLs never span a newline, so each block is scanned on its own
+        all_trackers = []
+        has_text = False
+        for block in blocks:
+            if not has_text and block.strip():
+                has_text = True
+            all_trackers.extend(self.parser.extract_trackers_from_text(block))
+        if not has_text:
+            raise ValueError("Please paste some tracker URLs first!")
         if not all_trackers:
             raise ValueError("No valid tracker URLs found!")
         
@@ -161,10 +170,13 @@ class MainController:
         self.is_validating = True
         self.validator.reset_stop_flag()
         self.validator.is_validating = True
-        self.trackers.validation_results.clear()
+        self.trackers.clear_results()
         
-        # Convert URLs to Tracker objects
-        trackers_to_validate = [Tracker(url) for url in self.trackers.unique_urls]
+        # Recycle the last run's Tracker objects only once its thread has exited; a stopped
+        # run's thread may still be writing to its own, so those are left to it
+        if self.validation_thread is None or not self.validation_thread.is_alive():
+            self.trackers.release_trackers()
+        trackers_to_validate = self.trackers.acquire_trackers(self.trackers.unique_urls)
         
         # Start validation in background thread
         self.validation_thread = threading.Thread(target=self._run_validation, args=(trackers_to_validate,), daemon=True)
@@ -206,15 +218,16 @@ class MainController:
                     self.view.safe_gui_update(self.view.update_progress, progress, i+1, total)
             
             # Update the trackers collection with results
-            self.trackers.validation_results = results
+            self.trackers.set_results(results, validated_at=start_time)
             
             elapsed = time.time() - start_time
             working_count = len([r for r in results if r.alive])
             
             # Save to database
             if hasattr(self, 'database') and self.database:
+                validated_at = self.trackers.validated_at
                 for tracker in results:
-                    self.database.save_tracker_result(tracker)
+                    self.database.save_tracker_result(tracker, checked_at=validated_at)
                 self.database.save_validation_session(
                     total_trackers=len(results),
                     working_trackers=working_count,
@@ -238,28 +251,63 @@ class MainController:
     
     # ===== EXPORT AND COPY METHODS =====
     
+    @property
+    def working_tracker_count(self) -> int:
+        """Number of working trackers (lines in a TXT export)"""
+        return self.trackers.working_count
+    
+    @property
+    def result_count(self) -> int:
+        """Number of validation results (records in a JSON/CSV export)"""
+        return len(self.trackers.results)
+    
     def export_working_trackers(self) -> str:
         """Export working trackers as text"""
-        return '\n'.join(tracker.url for tracker in self.trackers.working_trackers)
+        return '\n'.join(self.trackers.working_urls)
     
     def export_all_results(self) -> dict:
         """Export all results as structured data"""
+        columns = self.trackers.results
         return {
-            'timestamp': time.time(),
-            'total_trackers': len(self.trackers.validation_results),
-            'working_trackers': len(self.trackers.working_trackers),
-            'results': [
-                {
-                    'url': tracker.url,
-                    'alive': tracker.alive,
-                    'response_time': tracker.response_time,
-                    'error': tracker.error,
-                    'type': tracker.tracker_type
-                }
-                for tracker in self.trackers.validation_results
-            ]
+            'timestamp': self._export_timestamp(columns),
+            'total_trackers': len(columns),
+            'working_trackers': columns.alive.count(1),
+            'results': list(self.iter_result_records(columns))
         }
     
+    def _export_timestamp(self, columns=None) -> float:
+        """When the exported results were validated (now if nothing has been validated)"""
+        validated_at = (self.trackers.results if columns is None else columns).validated_at
+        return time.time() if validated_at is None else validated_at
+    
+    def iter_result_records(self, columns=None):
+        """Yield one export record per result, read straight from the result columns"""
+        if columns is None:
+            columns = self.trackers.results
+        for url, alive, response_time, error, tracker_type in zip(
+                columns.urls, columns.alive, columns.response_time, columns.error, columns.tracker_type):
+            yield {
+                'url': url,
+                'alive': bool(alive),
+                'response_time': None if math.isnan(response_time) else response_time,
+                'error': error,
+                'type': tracker_type
+            }
+    
+    def write_results_json(self, f):
+        """Stream export_all_results() as JSON into f, one compact record per line"""
+        # Runs on the file worker: a new run rebinds trackers.results rather than mutating
+        # it, so holding this one columns object keeps header and records consistent
+        columns = self.trackers.results
+        f.write('{"timestamp": %s, "total_trackers": %d, "working_trackers": %d, "results": [' % (
+            json.dumps(self._export_timestamp(columns)), len(columns), columns.alive.count(1)))
+        separator = '\n'
+        for record in self.iter_result_records(columns):
+            f.write(separator)
+            json.dump(record, f, ensure_ascii=False)
+            separator = ',\n'
+        f.write('\n]}\n')
+    
     def export_csv(self) -> str:
         """Export as CSV string"""
         output = io.StringIO()
@@ -292,16 +340,20 @@ class MainController:
     
     def copy_to_clipboard(self) -> str:
         """Copy working trackers to clipboard"""
-        working_urls = [tracker.url for tracker in self.trackers.working_trackers]
+        working_urls = self.trackers.working_urls
         if not working_urls:
             raise ValueError("No working trackers to copy!")
         return '\n'.join(working_urls)
     
     # ===== DATABASE AND HISTORY METHODS =====
     
-    def get_tracker_history(self, limit: int = 100):
-        """Get tracker validation history"""
-        return self.database.get_tracker_history(limit)
+    def get_tracker_history(self, limit: int = 100, **filters):
+        """Get tracker validation history (filters: alive, url_like, min_success, max_success, min_checks)"""
+        return self.database.get_tracker_history(limit, **filters)
+    
+    def get_history_stats(self, limit: int = 100):
+        """Get dashboard counters for the most recent `limit` history rows"""
+        return self.database.get_history_stats(limit)
     
     def get_reliable_trackers(self, min_success_rate: float = 0.8, min_checks: int = 3):
         """Get reliable trackers based on historical data"""
@@ -1,6 +1,9 @@
 import tkinter as tk
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 # ===== PATH CONFIGURATION =====
@@ -12,13 +15,21 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 def setup_logging():
     """Configure application logging"""
+    # Callers only enqueue records; a background listener does the file/console I/O
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('tracker_manager.log')
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('tracker_manager.log'),
-            logging.StreamHandler()
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
 
 # ===== APPLICATION INITIALIZATION =====
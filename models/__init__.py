@@ -1,2 +1,2 @@
-from .tracker_models import Tracker, TrackerCollection, TrackerStats
+from .tracker_models import Tracker, TrackerCollection, TrackerPool, TrackerStats
 from .database_models import TrackerDatabase, TrackerHistory, ValidationSession
\ No newline at end of file
@@ -0,0 +1,88 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# models/_norm.pyx
+"""C kernel for Tracker.normalize_tracker_url on ASCII http/https/udp URLs"""
+
+from libc.stdlib cimport malloc, free
+
+# ===== BYTE HELPERS =====
+
+cdef inline bint _is_space(unsigned char c):
+    # Same ASCII set str.strip() removes
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+cdef inline unsigned char _lower(unsigned char c):
+    return c + 32 if 65 <= c <= 90 else c
+
+cdef inline bint _is_stripped_param(const unsigned char* src, Py_ssize_t start, Py_ssize_t end):
+    # tr= / ws= / as= (compared case-insensitively, matching url.lower())
+    cdef unsigned char c0, c1
+    if end - start < 3 or src[start + 2] != 61:  # '='
+        return False
+    c0 = _lower(src[start])
+    c1 = _lower(src[start + 1])
+    return (c0 == 116 and c1 == 114) or (c0 == 119 and c1 == 115) or (c0 == 97 and c1 == 115)
+
+# ===== NORMALIZATION KERNEL =====
+
+cpdef bytes normalize(bytes url):
+    """Normalize an ASCII tracker URL, or return None to use the Python path"""
+    cdef const unsigned char* src = url
+    cdef Py_ssize_t n = len(url)
+    cdef Py_ssize_t start = 0, end = n, i, ps, pe, cut, out_len = 0
+    cdef bint first_seg = True
+    cdef unsigned char* out
+
+    while start < end and _is_space(src[start]):
+        start += 1
+    while end > start and _is_space(src[end - 1]):
+        end -= 1
+
+    # Magnet links keep the regex path in Python
+    if end - start >= 7 and _lower(src[start]) == 109 and _lower(src[start + 1]) == 97 \
+            and _lower(src[start + 2]) == 103 and _lower(src[start + 3]) == 110 \
+            and _lower(src[start + 4]) == 101 and _lower(src[start + 5]) == 116 \
+            and src[start + 6] == 58:
+        return None
+
+    # An inner newline can end up last, where _TRAIL_RE's '$' behaves differently
+    for i in range(start, end):
+        if src[i] == 10:
+            return None
+
+    out = <unsigned char*> malloc(end - start + 1)
+    if out == NULL:
+        raise MemoryError()
+    try:
+        # Same result as _TR_PARAM_RE.sub: walk the '&'-separated segments
+        i = start
+        while True:
+            ps = i
+            pe = i
+            while pe < end and src[pe] != 38:  # '&'
+                pe += 1
+            # '&tr=x' drops the whole segment together with its '&'
+            if first_seg or pe - ps <= 3 or not _is_stripped_param(src, ps, pe):
+                if not first_seg:
+                    out[out_len] = 38
+                    out_len += 1
+                # '?tr=x' cuts the segment at the leftmost qualifying '?'
+                cut = ps
+                while cut < pe and not (src[cut] == 63 and pe - cut > 4
+                                        and _is_stripped_param(src, cut + 1, pe)):
+                    cut += 1
+                while ps < cut:
+                    out[out_len] = _lower(src[ps])
+                    out_len += 1
+                    ps += 1
+            first_seg = False
+            if pe >= end:
+                break
+            i = pe + 1
+
+        # Equivalent of rstrip('?&')
+        while out_len > 0 and (out[out_len - 1] == 63 or out[out_len - 1] == 38):
+            out_len -= 1
+
+        return out[:out_len]
+    finally:
+        free(out)
@@ -2,7 +2,7 @@ import sqlite3
 from .tracker_models import Tracker
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -90,8 +90,8 @@ class TrackerDatabase:
     
     # ===== TRACKER DATA MANAGEMENT METHODS =====
     
-    def save_tracker_result(self, tracker: 'Tracker') -> int:
-        """Save or update tracker validation result"""
+    def save_tracker_result(self, tracker: 'Tracker', checked_at: Optional[float] = None) -> int:
+        """Save or update tracker validation result (checked_at: run-wide timestamp, defaults to now)"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
@@ -102,7 +102,8 @@ class TrackerDatabase:
             )
             result = cursor.fetchone()
             
-            current_time = datetime.now().isoformat()
+            current_time = (datetime.now() if checked_at is None
+                            else datetime.fromtimestamp(checked_at)).isoformat()
             
             if result:
                 # Update existing tracker
@@ -134,20 +135,77 @@ class TrackerDatabase:
             conn.commit()
             return tracker_id
     
-    def get_tracker_history(self, limit: int = 100) -> List[TrackerHistory]:
-        """Get recent tracker validation history"""
+    def get_tracker_history(self, limit: int = 100, alive: Optional[bool] = None, url_like: Optional[str] = None,
+                            min_success: Optional[float] = None, max_success: Optional[float] = None,
+                            min_checks: Optional[int] = None) -> List[TrackerHistory]:
+        """Get recent tracker validation history, filtered within the most recent `limit` rows"""
+        conditions = []
+        params = [limit]
+        if alive is not None:
+            conditions.append('alive = ?')
+            params.append(alive)
+        if url_like:
+            # Substring match; LIKE wildcards in the search text are taken literally
+            escaped = url_like.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            conditions.append("url LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        if min_checks is not None:
+            conditions.append('check_count >= ?')
+            params.append(min_checks)
+        if min_success is not None or max_success is not None:
+            conditions.append('check_count > 0')
+        if min_success is not None:
+            conditions.append('(success_count * 1.0 / check_count) >= ?')
+            params.append(min_success)
+        if max_success is not None:
+            conditions.append('(success_count * 1.0 / check_count) < ?')
+            params.append(max_success)
+        
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT * FROM trackers 
-                ORDER BY last_checked DESC 
-                LIMIT ?
-            ''', (limit,))
+            if not conditions:
+                cursor.execute('''
+                    SELECT * FROM trackers 
+                    ORDER BY last_checked DESC 
+                    LIMIT ?
+                ''', (limit,))
+            else:
+                cursor.execute(f'''
+                    SELECT * FROM (
+                        SELECT * FROM trackers 
+                        ORDER BY last_checked DESC 
+                        LIMIT ?
+                    )
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY last_checked DESC
+                ''', params)
             
             return [TrackerHistory(**dict(row)) for row in cursor.fetchall()]
     
+    def get_history_stats(self, limit: int = 100) -> Dict[str, int]:
+        """Dashboard counters over the most recent `limit` rows, aggregated in SQL"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) AS total,
+                       COALESCE(SUM(alive), 0) AS working,
+                       COALESCE(SUM(check_count), 0) AS total_checks,
+                       COALESCE(SUM(success_count), 0) AS successful_checks,
+                       COALESCE(SUM(check_count >= 3 AND success_count * 1.0 / check_count >= 0.9), 0) AS high_rel,
+                       COALESCE(SUM(check_count >= 3 AND success_count * 1.0 / check_count >= 0.7
+                                    AND success_count * 1.0 / check_count < 0.9), 0) AS medium_rel,
+                       COALESCE(SUM(check_count >= 3 AND success_count * 1.0 / check_count < 0.7), 0) AS low_rel
+                FROM (
+                    SELECT alive, check_count, success_count FROM trackers 
+                    ORDER BY last_checked DESC 
+                    LIMIT ?
+                )
+            ''', (limit,))
+            return dict(cursor.fetchone())
+    
     def get_reliable_trackers(self, min_success_rate: float = 0.8, min_checks: int = 3) -> List[TrackerHistory]:
         """Get trackers with high reliability"""
         with sqlite3.connect(self.db_path) as conn:
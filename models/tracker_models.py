@@ -1,15 +1,63 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 import time
 import re
+import math
+from array import array
+from collections import deque
+from itertools import compress
 from urllib.parse import urlparse
 import logging
+import sys
 from functools import lru_cache
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Optional compiled normalizer (build with: cythonize -i models/_norm.pyx)
+try:
+    from models._norm import normalize as _c_normalize
+    NORM_EXT_AVAILABLE = True
+except ImportError:
+    NORM_EXT_AVAILABLE = False
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# ===== PRECOMPILED PATTERNS =====
+
+_TR_PARAM_RE = re.compile(r'[?&](tr|ws|as)=[^&]+')
+_TRAIL_RE = re.compile(r'[?&]+$')
+_MAGNET_RE = re.compile(r'[?&]xt=urn:btih:([a-fA-F0-9]{40}|[a-zA-Z2-7]{32})', re.I)
+
+# Schemes accepted by Tracker.sanitize_tracker_url
+_SANITIZE_SCHEMES = ('http', 'https', 'udp')
+
+# Query parameters that never affect tracker identity
+_STRIPPED_PARAMS = ('tr=', 'ws=', 'as=')
+
+def _strip_params(url):
+    """Same result as _TR_PARAM_RE.sub('', url), using str methods only"""
+    parts = url.split('&')
+    kept = []
+    for i, part in enumerate(parts):
+        # '&tr=x' - the whole segment up to the next '&' goes, with its '&'
+        if i and len(part) > 3 and part.startswith(_STRIPPED_PARAMS):
+            continue
+        # '?tr=x' - leftmost qualifying '?' in the segment; it runs to the next '&'
+        q = part.find('?')
+        while q != -1:
+            if len(part) - q > 4 and part.startswith(_STRIPPED_PARAMS, q + 1):
+                part = part[:q]
+                break
+            q = part.find('?', q + 1)
+        kept.append(part)
+    return '&'.join(kept)
+
+# Flips 0/1 alive flags so dead rows can be selected at C speed
+_INVERT_FLAGS = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Tracker:
     """Represents a single tracker with its properties"""
     url: str
@@ -17,33 +65,50 @@ class Tracker:
     response_time: float = None
     error: str = None
     tracker_type: str = 'unknown'
+    _norm: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     # ===== PROPERTY METHODS =====
     
     @property
     def normalized_url(self):
-        return Tracker.normalize_tracker_url(self.url)
+        # Memoized per instance - dedup and DB saves read this repeatedly
+        if self._norm is None:
+            self._norm = Tracker.normalize_tracker_url_cached(self.url)
+        return self._norm
     
     # ===== URL PROCESSING METHODS =====
     
     @staticmethod
     def normalize_tracker_url(url: str) -> str:
         """Normalize tracker URL for duplicate detection"""
+        # Compiled kernel handles ASCII non-magnet URLs; it returns None for magnets
+        if NORM_EXT_AVAILABLE and url.isascii():
+            result = _c_normalize(url.encode('ascii'))
+            if result is not None:
+                return result.decode('ascii')
+        
         url = url.lower().strip()
         
+        # Fast path for http/https/udp - plain str methods, no regex engine.
+        # Output must match _TR_PARAM_RE/_TRAIL_RE exactly: it is the DB's unique key
+        if not url.startswith('magnet:'):
+            if '?' in url or '&' in url:
+                url = _strip_params(url)
+            # '$' also matches before a final newline, which rstrip would not see past
+            return url.rstrip('?&') if not url.endswith('\n') else _TRAIL_RE.sub('', url)
+        
         # Remove common non-essential parameters and clean up trailing ?/&
-        url = re.sub(r'[?&](tr|ws|as)=[^&]+', '', url)
-        url = re.sub(r'[?&]+$', '', url)
+        url = _TR_PARAM_RE.sub('', url)
+        url = _TRAIL_RE.sub('', url)
         
         # Standardize magnet links
-        if url.startswith('magnet:'):
-            if match := re.search(r'[?&]xt=urn:btih:([a-fA-F0-9]{40}|[a-zA-Z2-7]{32})', url, re.I):
-                return f"magnet:btih:{match.group(1).lower()}"
+        if match := _MAGNET_RE.search(url):
+            return f"magnet:btih:{match.group(1).lower()}"
         
         return url
 
     @staticmethod
-    @lru_cache(maxsize=1000)
+    @lru_cache(maxsize=16384)
     def normalize_tracker_url_cached(url: str) -> str:
         """Cached version for performance with size limit"""
         return Tracker.normalize_tracker_url(url)
@@ -56,6 +121,17 @@ class Tracker:
     @staticmethod
     def sanitize_tracker_url(url: str) -> Optional[str]:
         """Sanitize and validate tracker URLs"""
+        # Fast path: plain scheme://host[:port]/... needs no urlparse
+        scheme, sep, rest = url.partition('://')
+        simple = (sep and url.isprintable() and not url.startswith(' ')
+                  and '@' not in rest and '[' not in rest and ']' not in rest)
+        if simple:
+            if scheme.lower() not in _SANITIZE_SCHEMES:
+                return None
+            host = rest.partition('/')[0].partition('?')[0].partition('#')[0].partition(':')[0]
+            return url if host else None
+        
+        # Userinfo, IPv6 brackets, control characters: let urlparse decide
         try:
             parsed = urlparse(url)
             if parsed.scheme not in ['http', 'https', 'udp']:
@@ -67,36 +143,175 @@ class Tracker:
             return None
 
 
+class TrackerPool:
+    """Recycles Tracker instances across validation runs"""
+    
+    def __init__(self, max_size: int = 100000):
+        self.max_size = max_size
+        self._free = deque()
+    
+    # ===== POOL MANAGEMENT METHODS =====
+    
+    def acquire(self, url: str) -> Tracker:
+        """Get a freshly reset Tracker for url, reusing a pooled one if available"""
+        try:
+            tracker = self._free.pop()
+        except IndexError:
+            return Tracker(url)
+        
+        tracker.url = url
+        tracker.alive = False
+        tracker.response_time = None
+        tracker.error = None
+        tracker.tracker_type = 'unknown'
+        tracker._norm = None
+        return tracker
+    
+    def release(self, tracker: Tracker):
+        """Return a Tracker to the pool (dropped once max_size is reached)"""
+        if len(self._free) < self.max_size:
+            self._free.append(tracker)
+    
+    def __len__(self):
+        return len(self._free)
+
+
+class TrackerColumns:
+    """Column-oriented (struct-of-arrays) storage for validation results"""
+    
+    def __init__(self):
+        self.urls: List[str] = []
+        self.alive = array('B')
+        self.response_time = array('d')  # NaN marks a missing response time
+        self.error: List[Optional[str]] = []
+        self.tracker_type: List[str] = []
+        self.validated_at: Optional[float] = None  # one timestamp for the whole run
+    
+    @classmethod
+    def from_trackers(cls, trackers: List[Tracker], validated_at: Optional[float] = None) -> 'TrackerColumns':
+        """Build columns from a list of Tracker objects"""
+        columns = cls()
+        columns.extend(trackers)
+        columns.validated_at = time.time() if validated_at is None else validated_at
+        return columns
+    
+    # ===== COLUMN MANAGEMENT METHODS =====
+    
+    def extend(self, trackers: List[Tracker]):
+        """Append trackers, copying their fields into the columns"""
+        for tracker in trackers:
+            self.urls.append(tracker.url)
+            self.alive.append(1 if tracker.alive else 0)
+            self.response_time.append(math.nan if tracker.response_time is None else tracker.response_time)
+            self.error.append(tracker.error)
+            self.tracker_type.append(tracker.tracker_type)
+    
+    def __len__(self):
+        return len(self.urls)
+    
+    # ===== QUERY METHODS =====
+    
+    def _flags(self, alive: bool) -> bytes:
+        flags = self.alive.tobytes()
+        return flags if alive else flags.translate(_INVERT_FLAGS)
+    
+    def indices(self, alive: bool = True) -> List[int]:
+        """Row indices whose alive flag matches"""
+        return list(compress(range(len(self.urls)), self._flags(alive)))
+    
+    def urls_where(self, alive: bool = True) -> List[str]:
+        """URLs whose alive flag matches, without building Tracker objects"""
+        return list(compress(self.urls, self._flags(alive)))
+    
+    def materialize(self, index: int) -> Tracker:
+        """Build a Tracker view of a single row"""
+        response_time = self.response_time[index]
+        return Tracker(
+            self.urls[index],
+            bool(self.alive[index]),
+            None if math.isnan(response_time) else response_time,
+            self.error[index],
+            self.tracker_type[index]
+        )
+
+
 class TrackerCollection:
     """Manages a collection of trackers with state"""
     
-    def __init__(self):
+    def __init__(self, pool: Optional[TrackerPool] = None):
+        self.pool = pool or TrackerPool()
         self.trackers: List[Tracker] = []
         self.unique_urls: List[str] = []
-        self.validation_results: List[Tracker] = []
+        self.results = TrackerColumns()
     
     # ===== COLLECTION MANAGEMENT METHODS =====
     
+    def acquire_trackers(self, urls: List[str]) -> List[Tracker]:
+        """Build the tracker list for a validation run from pooled instances"""
+        self.trackers = [self.pool.acquire(url) for url in urls]
+        return self.trackers
+    
+    def release_trackers(self):
+        """Hand the last run's trackers back to the pool; only once no thread still uses them"""
+        release = self.pool.release
+        for tracker in self.trackers:
+            release(tracker)
+        self.trackers = []
+    
+    def set_results(self, trackers: List[Tracker], validated_at: Optional[float] = None):
+        """Store a run's results, stamped with a single run-wide timestamp"""
+        self.results = TrackerColumns.from_trackers(trackers, validated_at)
+    
+    def clear_results(self):
+        """Drop stored results"""
+        # Rebind rather than clear so an export still reading the old columns sees a stable snapshot
+        self.results = TrackerColumns()
+    
     def clear(self):
         """Clear all data"""
-        self.trackers.clear()
+        # Rebind rather than clear so a running validation keeps its own list
+        self.trackers = []
         self.unique_urls.clear()
-        self.validation_results.clear()
+        self.clear_results()
     
     # ===== PROPERTY METHODS =====
     
+    @property
+    def validation_results(self) -> List[Tracker]:
+        """Materialized Tracker view of all stored results"""
+        materialize = self.results.materialize
+        return [materialize(i) for i in range(len(self.results))]
+    
+    @validation_results.setter
+    def validation_results(self, trackers: List[Tracker]):
+        self.set_results(trackers)
+    
+    @property
+    def validated_at(self) -> Optional[float]:
+        return self.results.validated_at
+    
     @property
     def working_trackers(self) -> List[Tracker]:
-        return [t for t in self.validation_results if t.alive]
+        materialize = self.results.materialize
+        return [materialize(i) for i in self.results.indices(alive=True)]
     
     @property
     def dead_trackers(self) -> List[Tracker]:
-        return [t for t in self.validation_results if not t.alive]
+        materialize = self.results.materialize
+        return [materialize(i) for i in self.results.indices(alive=False)]
+    
+    @property
+    def working_urls(self) -> List[str]:
+        return self.results.urls_where(alive=True)
+    
+    @property
+    def working_count(self) -> int:
+        return self.results.alive.count(1)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
-    """Enhanced result class with timestamps"""
+    """Enhanced result class with timestamps (pass a run-wide validated_at to skip per-result clock reads)"""
     url: str
     alive: bool
     response_time: Optional[float] = None
@@ -111,7 +326,7 @@ class ValidationResult:
             self.validated_at = time.time()
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TrackerStats:
     """Statistics data container"""
     total: int = 0
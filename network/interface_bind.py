@@ -17,12 +17,55 @@ except ImportError:
     NETIFACES_AVAILABLE = False
     logger.warning("netifaces not available - will use system commands for interface detection")
 
+# Try to import psutil, but make it optional
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+VPN_PREFIXES = ('tun', 'tap', 'wg', 'ppp')
+
+# Resolved once: None on platforms without SO_BINDTODEVICE (non-Linux)
+_BINDTODEVICE = getattr(socket, 'SO_BINDTODEVICE', None)
+
+class BoundAdapter(HTTPAdapter):
+    """HTTP adapter whose connection pools bind sockets to one interface"""
+    
+    def __init__(self, interface, *args, **kwargs):
+        self.interface = interface
+        self._socket_options = [(socket.SOL_SOCKET, _BINDTODEVICE, interface.encode() + b'\x00')]
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
 class InterfaceBinder:
     def __init__(self):
+        self._interfaces_cache = None
         self.available_interfaces = self.detect_interfaces()
     
     # ===== INTERFACE DETECTION METHODS =====
     
+    def detect_interfaces_psutil(self):
+        """Detect available network interfaces using psutil (single getifaddrs call)"""
+        interfaces = []
+        try:
+            for iface, addrs in psutil.net_if_addrs().items():
+                interface_type = 'VPN' if any(x in iface for x in VPN_PREFIXES) else 'Other'
+                for addr in addrs:
+                    if addr.family == socket.AF_INET and addr.address and addr.address != '127.0.0.1':
+                        interfaces.append({
+                            'name': iface,
+                            'ip': addr.address,
+                            'type': interface_type
+                        })
+            logger.debug(f"Found {len(interfaces)} interfaces using psutil")
+        except Exception as e:
+            logger.error(f"psutil detection failed: {e}")
+        return interfaces
+    
     def detect_interfaces_netifaces(self):
         """Detect available network interfaces using netifaces"""
         interfaces = []
@@ -33,7 +76,7 @@ class InterfaceBinder:
                     for addr_info in addrs[netifaces.AF_INET]:
                         ip = addr_info.get('addr', '')
                         if ip and ip != '127.0.0.1':
-                            interface_type = 'VPN' if any(x in iface for x in ['tun', 'tap', 'wg', 'ppp']) else 'Other'
+                            interface_type = 'VPN' if any(x in iface for x in VPN_PREFIXES) else 'Other'
                             interfaces.append({
                                 'name': iface,
                                 'ip': ip,
@@ -64,7 +107,7 @@ class InterfaceBinder:
                 if ip_match and current_interface:
                     ip = ip_match.group(1)
                     if ip != '127.0.0.1':
-                        interface_type = 'VPN' if any(x in current_interface for x in ['tun', 'tap', 'wg', 'ppp']) else 'Other'
+                        interface_type = 'VPN' if any(x in current_interface for x in VPN_PREFIXES) else 'Other'
                         interfaces.append({
                             'name': current_interface,
                             'ip': ip,
@@ -91,35 +134,31 @@ class InterfaceBinder:
         
         return interfaces
     
-    def detect_interfaces(self):
-        """Detect available network interfaces using best available method"""
-        if NETIFACES_AVAILABLE:
+    def detect_interfaces(self, refresh=False):
+        """Detect available network interfaces using best available method (cached)"""
+        if self._interfaces_cache is not None and not refresh:
+            return list(self._interfaces_cache)
+        
+        interfaces = []
+        if PSUTIL_AVAILABLE:
+            interfaces = self.detect_interfaces_psutil()
+        
+        if not interfaces and NETIFACES_AVAILABLE:
             interfaces = self.detect_interfaces_netifaces()
-            if interfaces:  # If netifaces found interfaces, use them
-                return interfaces
         
-        # Fallback to ip command if netifaces not available or found nothing
-        return self.detect_interfaces_ip_command()
+        # Last resort: ip command if no library found anything
+        if not interfaces:
+            interfaces = self.detect_interfaces_ip_command()
+        
+        self._interfaces_cache = interfaces
+        return list(interfaces)
     
     # ===== INTERFACE BINDING METHODS =====
     
     def bind_to_interface(self, session, interface_name):
         """Bind requests session to specific interface (Linux only)"""
-        if not hasattr(socket, 'SO_BINDTODEVICE'):
+        if _BINDTODEVICE is None:
             return session  # Not supported on this platform
-            
-        class BoundAdapter(HTTPAdapter):
-            def __init__(self, interface, *args, **kwargs):
-                self.interface = interface
-                super().__init__(*args, **kwargs)
-            
-            def init_poolmanager(self, *args, **kwargs):
-                if hasattr(socket, 'SO_BINDTODEVICE'):
-                    kwargs['socket_options'] = [
-                        (socket.SOL_SOCKET, socket.SO_BINDTODEVICE, 
-                         self.interface.encode() + b'\x00')
-                    ]
-                super().init_poolmanager(*args, **kwargs)
         
         adapter = BoundAdapter(interface_name)
         session.mount("http://", adapter)
@@ -130,4 +169,4 @@ class InterfaceBinder:
     
     def is_linux(self):
         """Check if running on Linux"""
-        return hasattr(socket, 'SO_BINDTODEVICE')
\ No newline at end of file
+        return _BINDTODEVICE is not None
\ No newline at end of file
@@ -24,13 +24,10 @@ class DuplicateRemoverPlugin(Plugin):
     # ===== PLUGIN IMPLEMENTATION METHODS =====
     
     def before_validation(self, trackers: List[Tracker]) -> List[Tracker]:
-        seen = set()
-        unique = []
-        for tracker in trackers:
-            if tracker.normalized_url not in seen:
-                seen.add(tracker.normalized_url)
-                unique.append(tracker)
-        return unique
+        first_index = {}
+        for i, key in enumerate(tracker.normalized_url for tracker in trackers):
+            first_index.setdefault(key, i)
+        return [trackers[i] for i in first_index.values()]
     
     def after_validation(self, results: List[Tracker]) -> List[Tracker]:
         return results
@@ -1,11 +1,38 @@
 import re
+import csv
+import io
 import json  
-from typing import List
+from typing import Callable, Dict, List
 from models.tracker_models import Tracker
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional - fall back to the stdlib decoder when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# google-re2 is optional - its linear-time DFA is used for large pasted inputs
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+_URL_PATTERN = r'\b(https?://[^\s<>"{}|\\^`\[\]]+|udp://[^\s<>"{}|\\^`\[\]]+|magnet:\?[^\s<>"{}|\\^`\[\]]+)\b'
+_URL_RE = re.compile(_URL_PATTERN)
+_URL_RE2 = re2.compile(_URL_PATTERN) if RE2_AVAILABLE else None
+
+# (list, length, casefolded copy) of the last list filter_trackers searched, so repeated
+# queries over the same list (one per keystroke) reuse the index instead of re-folding it
+_filter_index = (None, 0, [])
+
+# ASCII inputs above this size (characters) are scanned with re2 when available
+RE2_MIN_TEXT_SIZE = 64 * 1024
+
 class TrackerParser:
     """Handles tracker parsing and duplicate detection"""
     
@@ -14,51 +41,50 @@ class TrackerParser:
     @staticmethod
     def extract_trackers_from_text(text: str) -> List[str]:
         """Extract tracker URLs from text"""
-        url_pattern = r'\b(https?://[^\s<>"{}|\\^`\[\]]+|udp://[^\s<>"{}|\\^`\[\]]+|magnet:\?[^\s<>"{}|\\^`\[\]]+)\b'
-        matches = re.findall(url_pattern, text)
+        # re2's \s and \b are ASCII-only; on ASCII text both engines agree exactly
+        if _URL_RE2 is not None and len(text) >= RE2_MIN_TEXT_SIZE and text.isascii():
+            matches = _URL_RE2.findall(text)
+        else:
+            matches = _URL_RE.findall(text)
         return [match.strip() for match in matches if match.strip()]
     
     @staticmethod
     def remove_duplicates(trackers: List[str]) -> List[str]:
         """Remove duplicate trackers"""
-        seen = set()
-        unique_trackers = []
-        
-        for tracker in trackers:
-            normalized = Tracker.normalize_tracker_url(tracker)
-            if normalized and normalized not in seen:
-                seen.add(normalized)
-                unique_trackers.append(tracker)
+        # Order-preserving dedup: first URL seen for each normalized key wins
+        first_seen = {}
+        for tracker, normalized in zip(trackers, map(Tracker.normalize_tracker_url_cached, trackers)):
+            if normalized:
+                first_seen.setdefault(normalized, tracker)
+        unique_trackers = list(first_seen.values())
         
         logger.info(f"Removed duplicates: {len(trackers)} -> {len(unique_trackers)}")
         return unique_trackers
     
     # ===== FORMAT-SPECIFIC PARSING METHODS =====
     
+    @staticmethod
+    def detect_format(content: str) -> str:
+        """Sniff the format of a tracker list"""
+        if content.lstrip().startswith('['):
+            return 'json'
+        if '\n' in content and ',' in content:
+            return 'csv'
+        return 'txt'
+
     @staticmethod
     def parse_multiple_formats(content: str, format_type: str = 'auto') -> List[str]:
         """Parse tracker lists from different formats"""
         if format_type == 'auto':
-            # Auto-detect format
-            if content.strip().startswith('['):
-                format_type = 'json'
-            elif '\n' in content and ',' in content:
-                format_type = 'csv'
-            else:
-                format_type = 'txt'
-        
-        if format_type == 'json':
-            return TrackerParser.parse_json(content)
-        elif format_type == 'csv':
-            return TrackerParser.parse_csv(content)
-        else:  # txt
-            return TrackerParser.extract_trackers_from_text(content)
+            format_type = TrackerParser.detect_format(content)
+        parser = _FORMAT_PARSERS.get(format_type, TrackerParser.extract_trackers_from_text)
+        return parser(content)
 
     @staticmethod
     def parse_json(content: str) -> List[str]:
         """Parse JSON tracker list"""
         try:
-            data = json.loads(content)
+            data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
             if isinstance(data, list):
                 return [str(item) for item in data if isinstance(item, str)]
             elif isinstance(data, dict) and 'trackers' in data:
@@ -70,14 +96,20 @@ class TrackerParser:
     @staticmethod  
     def parse_csv(content: str) -> List[str]:
         """Parse CSV tracker list"""
+        if not content:
+            return []
         try:
-            import csv
-            reader = csv.reader(content.splitlines())
-            trackers = []
-            for row in reader:
-                if row and row[0]:
-                    trackers.append(row[0].strip())
-            return trackers
+            # Unquoted single-column lists: slice the first field off each streamed line
+            if '"' not in content:
+                trackers = []
+                for line in io.StringIO(content, newline=None):
+                    first = line.split(',', 1)[0].rstrip('\n')
+                    if first:
+                        trackers.append(first.strip())
+                return trackers
+            
+            reader = csv.reader(io.StringIO(content, newline=''))
+            return [row[0].strip() for row in reader if row and row[0]]
         except Exception:
             return []
     
@@ -85,8 +117,22 @@ class TrackerParser:
     
     @staticmethod
     def filter_trackers(trackers: List[str], query: str) -> List[str]:
-        """Filter trackers by search query"""
+        """Filter trackers by search query (case-insensitive)"""
+        global _filter_index
         if not query:
             return trackers
-        query = query.lower()
-        return [t for t in trackers if query in t.lower()]
\ No newline at end of file
+        indexed, length, lowered = _filter_index
+        # Rebuilt when a different or resized list comes in
+        if indexed is not trackers or length != len(trackers):
+            lowered = [t.casefold() for t in trackers]
+            _filter_index = (trackers, len(trackers), lowered)
+        query = query.casefold()
+        return [t for t, low in zip(trackers, lowered) if query in low]
+
+
+# Format -> parser dispatch table used by parse_multiple_formats
+_FORMAT_PARSERS: Dict[str, Callable[[str], List[str]]] = {
+    'json': TrackerParser.parse_json,
+    'csv': TrackerParser.parse_csv,
+    'txt': TrackerParser.extract_trackers_from_text,
+}
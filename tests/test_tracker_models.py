@@ -0,0 +1,69 @@
+import unittest
+
+from models.tracker_models import Tracker, TrackerPool, _TR_PARAM_RE, _TRAIL_RE
+
+
+def _regex_normalize(url):
+    """The original regex normalizer; stored normalized_url keys were built with it"""
+    url = url.lower().strip()
+    url = _TR_PARAM_RE.sub('', url)
+    return _TRAIL_RE.sub('', url)
+
+
+class NormalizeTrackerUrlTests(unittest.TestCase):
+    """normalized_url is the trackers table's unique key, so its output must never drift"""
+
+    CASES = [
+        'http://tracker.example.com:80/announce',
+        'HTTP://Tracker.Example.com/announce?',
+        'udp://tracker.example.com:1337/announce&',
+        'http://x/a?tr=1&b=2',
+        'http://x/a?b=2&tr=1',
+        'http://x/a?tr=&b=1',
+        'http://x/a?b=1&&c=2',
+        'http://x/a&tr=1?b=2',
+        'http://x/a?ws=http://seed&as=http://src&key=1',
+        'http://x/a?tr=1?b=2&c=3',
+        'http://x/a??tr=1',
+        '  https://x/announce?passkey=ABC  ',
+    ]
+
+    def test_matches_regex_normalizer(self):
+        for url in self.CASES:
+            with self.subTest(url=url):
+                self.assertEqual(Tracker.normalize_tracker_url(url), _regex_normalize(url))
+
+    def test_known_outputs(self):
+        self.assertEqual(Tracker.normalize_tracker_url('http://x/a?tr=1&b=2'), 'http://x/a&b=2')
+        self.assertEqual(Tracker.normalize_tracker_url('http://x/a?tr=&b=1'), 'http://x/a?tr=&b=1')
+        self.assertEqual(Tracker.normalize_tracker_url('http://x/a?b=1&&c=2'), 'http://x/a?b=1&&c=2')
+        self.assertEqual(Tracker.normalize_tracker_url('http://x/a&tr=1?b=2'), 'http://x/a')
+
+    def test_magnet_links(self):
+        magnet = 'magnet:?xt=urn:btih:' + 'A' * 40 + '&tr=udp://t/announce'
+        self.assertEqual(Tracker.normalize_tracker_url(magnet), 'magnet:btih:' + 'a' * 40)
+
+
+class TrackerPoolTests(unittest.TestCase):
+
+    def test_acquire_resets_recycled_tracker(self):
+        pool = TrackerPool()
+        tracker = pool.acquire('http://a/announce')
+        tracker.alive, tracker.response_time, tracker.error = True, 0.5, 'timeout'
+        tracker.normalized_url
+        pool.release(tracker)
+        
+        reused = pool.acquire('udp://b/announce')
+        self.assertIs(reused, tracker)
+        self.assertEqual(reused, Tracker('udp://b/announce'))
+        self.assertEqual(reused.normalized_url, 'udp://b/announce')
+
+    def test_release_respects_max_size(self):
+        pool = TrackerPool(max_size=1)
+        pool.release(Tracker('http://a'))
+        pool.release(Tracker('http://b'))
+        self.assertEqual(len(pool), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
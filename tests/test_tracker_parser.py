@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+
+from services import tracker_parser
+from services.tracker_parser import TrackerParser, RE2_MIN_TEXT_SIZE
+
+
+class ExtractTrackersTests(unittest.TestCase):
+
+    def test_non_ascii_url_is_not_truncated(self):
+        text = 'http://exemple.com/café x'
+        self.assertEqual(TrackerParser.extract_trackers_from_text(text), ['http://exemple.com/café'])
+
+    def test_large_non_ascii_input_stays_on_re(self):
+        # re2's ASCII-only \b would cut 'café' short, so it must not see this text
+        text = 'http://exemple.com/café\n' + 'x' * RE2_MIN_TEXT_SIZE
+        fake_re2 = mock.Mock()
+        with mock.patch.object(tracker_parser, '_URL_RE2', fake_re2):
+            urls = TrackerParser.extract_trackers_from_text(text)
+        fake_re2.findall.assert_not_called()
+        self.assertEqual(urls, ['http://exemple.com/café'])
+
+    def test_large_ascii_input_uses_re2(self):
+        text = 'udp://tracker.example.com:1337/announce\n' + 'x' * RE2_MIN_TEXT_SIZE
+        fake_re2 = mock.Mock()
+        fake_re2.findall.return_value = ['udp://tracker.example.com:1337/announce']
+        with mock.patch.object(tracker_parser, '_URL_RE2', fake_re2):
+            urls = TrackerParser.extract_trackers_from_text(text)
+        fake_re2.findall.assert_called_once_with(text)
+        self.assertEqual(urls, ['udp://tracker.example.com:1337/announce'])
+
+
+class FilterTrackersTests(unittest.TestCase):
+
+    def test_case_insensitive_substring(self):
+        urls = ['HTTP://Tracker.Example.com/announce', 'udp://other.org:80', 'http://STRASSE.de']
+        self.assertEqual(TrackerParser.filter_trackers(urls, 'example'), [urls[0]])
+        self.assertEqual(TrackerParser.filter_trackers(urls, 'straße'), [urls[2]])
+        self.assertEqual(TrackerParser.filter_trackers(urls, ''), urls)
+
+    def test_index_follows_list_changes(self):
+        urls = ['http://a.org']
+        self.assertEqual(TrackerParser.filter_trackers(urls, 'a.org'), urls)
+        urls.append('http://b.org')
+        self.assertEqual(TrackerParser.filter_trackers(urls, 'b.org'), ['http://b.org'])
+        other = ['http://c.org']
+        self.assertEqual(TrackerParser.filter_trackers(other, 'c.org'), other)
+
+
+if __name__ == '__main__':
+    unittest.main()
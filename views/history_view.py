@@ -1,15 +1,163 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import logging
+import time
+from collections import deque
+from functools import lru_cache
 from typing import List
 from models.database_models import TrackerHistory
+from views.virtual_tree import VirtualTreeWindow
 
 logger = logging.getLogger(__name__)
 
+# Delay after the last keystroke before the search refreshes the table
+SEARCH_DEBOUNCE_MS = 200
+
+# Seconds a history query result is reused across filter/search/limit changes
+HISTORY_CACHE_TTL = 2.0
+
+# Position of the "Validate Again" entry in the history context menu
+VALIDATE_MENU_INDEX = 3
+
+# Filter combobox choice -> SQL-side filter arguments for get_tracker_history
+_FILTER_QUERIES = {
+    "All": {},
+    "Working Only": {'alive': True},
+    "Dead Only": {'alive': False},
+    "High Reliability (>90%)": {'min_checks': 3, 'min_success': 0.9},
+    "Medium Reliability (70-90%)": {'min_checks': 3, 'min_success': 0.7, 'max_success': 0.9},
+    "Low Reliability (<70%)": {'min_checks': 3, 'max_success': 0.7},
+}
+
+# First six URL characters -> (full scheme prefix, display type)
+_TYPE_BY_PREFIX = {
+    'udp://': ('udp://', "UDP"),
+    'http:/': ('http://', "HTTP"),
+    'https:': ('https://', "HTTP"),
+    'magnet': ('magnet:', "Magnet"),
+}
+_UNKNOWN_TYPE = ('', "Unknown")
+
+# ===== ROW TAGS =====
+
+_STATUS_TEXT = {True: "Working", False: "Dead"}
+
+# (alive, reliability band) -> Treeview row tags
+_ROW_TAGS = {
+    (alive, band): (f"{band}_{'ok' if alive else 'bad'}",)
+    for alive in (True, False)
+    for band in ('high', 'medium', 'other')
+}
+
+# Tag colors per theme; high/medium bands tint the row, the rest tint the text
+_ROW_TAG_COLORS = {
+    False: {
+        'high_ok': {'background': '#d4f7d4'},
+        'high_bad': {'background': '#f7d4d4'},
+        'medium_ok': {'background': '#fff4c2'},
+        'medium_bad': {'background': '#ffe0c2'},
+        'other_ok': {'foreground': '#1a7f37'},
+        'other_bad': {'foreground': '#b42318'},
+    },
+    True: {
+        'high_ok': {'background': '#1f3d27'},
+        'high_bad': {'background': '#4a2323'},
+        'medium_ok': {'background': '#3d3a1f'},
+        'medium_bad': {'background': '#4a3520'},
+        'other_ok': {'foreground': '#7ee787'},
+        'other_bad': {'foreground': '#ff7b72'},
+    },
+}
+
+# ===== ROW FORMATTING =====
+
+# Pre-bound format templates shared by every row formatter
+_RT_FMT = "{:.2f}s".format
+_SR_FMT = "{:.1f}%".format
+_ZERO_RATE = _SR_FMT(0)
+
+def _short_rt(response_time):
+    """Response time cell text"""
+    return _RT_FMT(response_time) if response_time else "N/A"
+
+def _short_ts(last_checked):
+    """Last-checked cell text (timestamp trimmed to seconds)"""
+    return last_checked[:19] if last_checked else "Never"
+
+# Rows are memoized on their raw fields so unchanged trackers skip all formatting on refresh.
+# Each formatter returns (values, tags); reliability is shown through row tag colors.
+@lru_cache(maxsize=2048)
+def _format_history_row(url, alive, check_count, success_count, response_time, last_checked):
+    """Build the display values and row tags for a history row"""
+    success_rate = (success_count / check_count * 100) if check_count > 0 else 0
+    
+    # Reliability band selects the row color tag
+    band = 'other'
+    if check_count >= 3:
+        if success_rate >= 90:
+            band = 'high'
+        elif success_rate >= 70:
+            band = 'medium'
+    
+    # Determine tracker type from URL: one slice + dict probe, then confirm the full prefix
+    prefix, tracker_type = _TYPE_BY_PREFIX.get(url[:6], _UNKNOWN_TYPE)
+    if not url.startswith(prefix):
+        tracker_type = "Unknown"
+    
+    return (
+        url,
+        _STATUS_TEXT[bool(alive)],
+        _short_rt(response_time),
+        _short_ts(last_checked),
+        _SR_FMT(success_rate) if check_count > 0 else _ZERO_RATE,
+        check_count,
+        tracker_type
+    ), _ROW_TAGS[(bool(alive), band)]
+
+@lru_cache(maxsize=2048)
+def _format_favorite_row(url, alive, check_count, success_count, response_time, last_checked):
+    """Build the display values and row tags for a favorites row"""
+    return (
+        url,
+        _STATUS_TEXT[bool(alive)],
+        _short_rt(response_time),
+        _short_ts(last_checked),
+        _SR_FMT(success_count / check_count * 100) if check_count > 0 else _ZERO_RATE,
+        check_count,
+        "Favorite"
+    ), _ROW_TAGS[(bool(alive), 'other')]
+
+# ===== DASHBOARD STATS =====
+
+def _history_stats(history):
+    """Single pass over fetched history rows, same counters as TrackerDatabase.get_history_stats"""
+    working = total_checks = successful_checks = 0
+    high_rel = medium_rel = low_rel = 0
+    for t in history:
+        if t.alive:
+            working += 1
+        total_checks += t.check_count
+        successful_checks += t.success_count
+        if t.check_count >= 3:
+            rate = t.success_count / t.check_count
+            if rate >= 0.9:
+                high_rel += 1
+            elif rate >= 0.7:
+                medium_rel += 1
+            else:
+                low_rel += 1
+    return {'total': len(history), 'working': working, 'total_checks': total_checks,
+            'successful_checks': successful_checks, 'high_rel': high_rel,
+            'medium_rel': medium_rel, 'low_rel': low_rel}
+
 class HistoryView:
     def __init__(self, parent, controller):
         self.parent = parent
         self.controller = controller
+        self._last_rows = {}  # iid -> row values currently shown, in display order
+        self._search_job = None  # pending debounced search refresh
+        self._history_cache = {}  # (limit, filters) or (limit, 'stats') -> (fetched_at, value)
+        self._theme_signature = None  # palette last applied by apply_theme
         self.setup_gui()
     
     # ===== GUI SETUP METHODS =====
@@ -30,7 +178,7 @@ class HistoryView:
         top_controls.pack(fill='x', pady=(0, 10))
         
         ttk.Button(top_controls, text="🔄 Refresh", 
-                command=self.refresh_history).pack(side='left', padx=(0, 10))
+                command=self.force_refresh).pack(side='left', padx=(0, 10))
         
         ttk.Button(top_controls, text="⭐ Show Reliable",
                 command=self.show_reliable).pack(side='left', padx=(0, 10))
@@ -100,15 +248,22 @@ class HistoryView:
         self.tree.column('Checks', width=60, anchor='center')
         self.tree.column('Type', width=80, anchor='center')
         
+        # Reliability colors are row tags, configured once per theme rather than per row
+        self._theme_row_tags(False)
+        
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(self.tab, orient='vertical', command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(self.tab, orient='horizontal', command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = ttk.Scrollbar(self.tab, orient='vertical', command=self.tree.yview)
+        self.h_scrollbar = ttk.Scrollbar(self.tab, orient='horizontal', command=self.tree.xview)
+        self.tree.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
         
         # Pack everything
         self.tree.pack(side='top', fill='both', expand=True, padx=5, pady=5)
-        v_scrollbar.pack(side='right', fill='y')
-        h_scrollbar.pack(side='bottom', fill='x')
+        self.v_scrollbar.pack(side='right', fill='y')
+        self.h_scrollbar.pack(side='bottom', fill='x')
+        
+        # Only the rows in view are inserted; the vertical scrollbar drives the window
+        self.window = VirtualTreeWindow(self.tree, self.v_scrollbar, self._populate_tree,
+                                        key=lambda row: row[0])
         
         # Enhanced bindings
         self.tree.bind('<Double-1>', self.on_double_click)
@@ -119,7 +274,7 @@ class HistoryView:
         self.context_menu.add_command(label="Add to Favorites", command=self.add_selected_to_favorites)
         self.context_menu.add_command(label="Copy URL", command=self.copy_selected_url)
         self.context_menu.add_separator()
-        self.context_menu.add_command(label="Validate Again", command=self.validate_selected)
+        self.context_menu.add_command(label="Validate Again", command=self.validate_selected)  # VALIDATE_MENU_INDEX
         
         # Collect all labels for theming
         self._label_widgets = []
@@ -167,7 +322,12 @@ class HistoryView:
         """Apply theme to history tab widgets - SIMPLIFIED AND FOCUSED"""
         try:
             # Get dark mode state from main view
-            is_dark_mode = getattr(self.controller.main_view, 'is_dark_mode', False)
+            is_dark_mode = getattr(self.controller.view, 'is_dark_mode', False)
+            
+            # Repeated applies of the same palette are no-ops; the tree data is never rebuilt for theming
+            signature = (bg_color, fg_color, text_bg, text_fg, is_dark_mode)
+            if signature == self._theme_signature:
+                return
             
             if is_dark_mode:
                 # DARK MODE - Direct and simple approach
@@ -182,6 +342,10 @@ class HistoryView:
             # Theme context menu
             self._theme_context_menu(bg_color, fg_color, is_dark_mode)
             
+            # Row reliability colors
+            self._theme_row_tags(is_dark_mode)
+            
+            self._theme_signature = signature
         except Exception as e:
             logger.debug(f"Could not theme history view: {e}")
     
@@ -253,25 +417,6 @@ class HistoryView:
                         label.configure(bg=bg_color, fg=fg_color)
                 except Exception as e:
                     logger.debug(f"Could not theme label: {e}")
-        
-        # Apply recursive theming to catch any missed labels
-        self._theme_all_labels_recursive(self.tab, bg_color, fg_color)
-    
-    def _theme_all_labels_recursive(self, parent, bg_color, fg_color):
-        """Recursively theme ALL labels in the history tab"""
-        try:
-            for child in parent.winfo_children():
-                if isinstance(child, tk.Label):
-                    try:
-                        child.configure(bg=bg_color, fg=fg_color)
-                    except Exception as e:
-                        logger.debug(f"Could not theme label {child}: {e}")
-                
-                if hasattr(child, 'winfo_children'):
-                    self._theme_all_labels_recursive(child, bg_color, fg_color)
-                    
-        except Exception as e:
-            logger.debug(f"Error in recursive label theming: {e}")
     
     def _theme_context_menu(self, bg_color, fg_color, is_dark_mode):
         """Theme the context menu"""
@@ -295,114 +440,143 @@ class HistoryView:
         except Exception as e:
             logger.debug(f"Could not theme context menu: {e}")
     
+    def _theme_row_tags(self, is_dark_mode):
+        """Configure the reliability row tags for the current theme"""
+        for tag, options in _ROW_TAG_COLORS[bool(is_dark_mode)].items():
+            self.tree.tag_configure(tag, **options)
+    
     def _collect_labels(self, parent):
-        """Collect all Label widgets for efficient theming"""
+        """Collect all Label widgets below parent with one winfo_children call per widget"""
+        pending = deque([parent])
         try:
-            for child in parent.winfo_children():
-                if child.winfo_class() == 'Label':
-                    self._label_widgets.append(child)
-                if child.winfo_children():
-                    self._collect_labels(child)
+            while pending:
+                kids = pending.popleft().winfo_children()
+                for child in kids:
+                    if child.winfo_class() == 'Label':
+                        self._label_widgets.append(child)
+                pending.extend(kids)
         except Exception as e:
             logger.debug(f"Could not collect labels from {parent}: {e}")
     
+    # ===== TREE POPULATION METHODS =====
+    
+    @staticmethod
+    def _row_iid(tracker):
+        """Stable Treeview item id for a tracker (database id, URL as fallback)"""
+        return str(tracker.id) if tracker.id is not None else tracker.url
+    
+    def _populate_tree(self, keyed_rows):
+        """Diff (iid, (values, tags)) pairs against the tree and apply only the changes"""
+        new_rows = {}
+        for iid, row in keyed_rows:
+            new_rows.setdefault(iid, row)
+        
+        last = self._last_rows
+        stale = [iid for iid in last if iid not in new_rows]
+        kept_order = [iid for iid in last if iid in new_rows]
+        reorder = kept_order != [iid for iid in new_rows if iid in last]
+        changed = [iid for iid in kept_order if last[iid] != new_rows[iid]]
+        added = len(new_rows) - len(kept_order)
+        
+        if not (stale or reorder or changed or added):
+            return
+        
+        tree = self.tree
+        try:
+            if stale:
+                tree.delete(*stale)
+            item = tree.item
+            for iid in changed:
+                values, tags = new_rows[iid]
+                item(iid, values=values, tags=tags)
+            if reorder or added:
+                insert, move = tree.insert, tree.move
+                for index, (iid, (values, tags)) in enumerate(new_rows.items()):
+                    if iid not in last:
+                        insert('', index, iid=iid, values=values, tags=tags)
+                    elif reorder:
+                        move(iid, '', index)
+            self._last_rows = new_rows
+        except tk.TclError as e:
+            # Tree no longer matches the cache - start over from an empty tree
+            logger.debug(f"History tree diff failed, rebuilding: {e}")
+            tree.delete(*tree.get_children())
+            self._last_rows = {}
+            for iid, (values, tags) in new_rows.items():
+                tree.insert('', 'end', iid=iid, values=values, tags=tags)
+            self._last_rows = new_rows
+    
     # ===== DATA MANAGEMENT METHODS =====
     
     def refresh_history(self, event=None):
         """Refresh history display with filters"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         limit = None if self.limit_var.get() == "All" else int(self.limit_var.get())
-        history = self.controller.get_tracker_history(limit=limit or 1000)
+        limit = limit or 1000
         
-        # Apply filters
-        filtered_history = self.apply_filters_to_history(history)
+        # Filters run in SQL; the dashboard keeps showing stats for the unfiltered rows,
+        # aggregated in SQL when those rows are not fetched anyway
+        filters = self.current_filter_query()
+        history = self._get_history(limit, filters)
+        stats = self._get_stats(limit) if filters else _history_stats(history)
         
-        for tracker in filtered_history:
-            success_rate = (tracker.success_count / tracker.check_count * 100) if tracker.check_count > 0 else 0
-            
-            # Color coding based on reliability
-            status_icon = "✅" if tracker.alive else "❌"
-            if tracker.check_count >= 3:
-                if success_rate >= 90:
-                    status_icon = "🟢" if tracker.alive else "🔴"
-                elif success_rate >= 70:
-                    status_icon = "🟡" if tracker.alive else "🟠"
-            
-            # Determine tracker type from URL
-            tracker_type = "Unknown"
-            if tracker.url.startswith('udp://'):
-                tracker_type = "UDP"
-            elif tracker.url.startswith(('http://', 'https://')):
-                tracker_type = "HTTP"
-            elif tracker.url.startswith('magnet:'):
-                tracker_type = "Magnet"
-            
-            self.tree.insert('', 'end', values=(
-                tracker.url,
-                f"{status_icon} {'Working' if tracker.alive else 'Dead'}",
-                f"{tracker.response_time:.2f}s" if tracker.response_time else "N/A",
-                tracker.last_checked[:19] if tracker.last_checked else "Never",
-                f"{success_rate:.1f}%",
-                tracker.check_count,
-                tracker_type
-            ))
-        
-        self.update_stats_dashboard(history)
-    
-    def apply_filters_to_history(self, history):
-        """Apply current filters to history data"""
-        filter_type = self.filter_var.get()
-        search_term = self.search_var.get().lower()
+        rows = [(self._row_iid(t), _format_history_row(t.url, t.alive, t.check_count, t.success_count,
+                                                        t.response_time, t.last_checked))
+                for t in history]
         
-        filtered = history
-        
-        # Apply type filter
-        if filter_type == "Working Only":
-            filtered = [t for t in filtered if t.alive]
-        elif filter_type == "Dead Only":
-            filtered = [t for t in filtered if not t.alive]
-        elif filter_type == "High Reliability (>90%)":
-            filtered = [t for t in filtered if t.check_count >= 3 and (t.success_count / t.check_count) >= 0.9]
-        elif filter_type == "Medium Reliability (70-90%)":
-            filtered = [t for t in filtered if t.check_count >= 3 and 0.7 <= (t.success_count / t.check_count) < 0.9]
-        elif filter_type == "Low Reliability (<70%)":
-            filtered = [t for t in filtered if t.check_count >= 3 and (t.success_count / t.check_count) < 0.7]
-        
-        # Apply search filter
+        self.window.set_rows(rows)
+        self.update_stats_dashboard(stats)
+    
+    def force_refresh(self):
+        """Refresh from the database, bypassing the short-lived history cache"""
+        self._history_cache.clear()
+        self.refresh_history()
+    
+    def _get_history(self, limit, filters=None):
+        """Fetch history, reusing results younger than HISTORY_CACHE_TTL for the same query"""
+        key = (limit, tuple(sorted(filters.items())) if filters else ())
+        return self._cached(key, lambda: self.controller.get_tracker_history(limit=limit, **(filters or {})))
+    
+    def _get_stats(self, limit):
+        """Fetch the SQL-aggregated dashboard stats, cached like _get_history"""
+        return self._cached((limit, 'stats'), lambda: self.controller.get_history_stats(limit))
+    
+    def _cached(self, key, fetch):
+        """Return the cached value for key if younger than HISTORY_CACHE_TTL, else fetch and store it"""
+        now = time.monotonic()
+        cached = self._history_cache.get(key)
+        if cached is not None and now - cached[0] < HISTORY_CACHE_TTL:
+            return cached[1]
+        value = fetch()
+        # Drop expired entries so one-off search terms do not accumulate
+        self._history_cache = {k: v for k, v in self._history_cache.items() if now - v[0] < HISTORY_CACHE_TTL}
+        self._history_cache[key] = (now, value)
+        return value
+    
+    def current_filter_query(self):
+        """Translate the filter and search widgets into get_tracker_history arguments"""
+        filters = dict(_FILTER_QUERIES.get(self.filter_var.get(), {}))
+        search_term = self.search_var.get().lower()
         if search_term:
-            filtered = [t for t in filtered if search_term in t.url.lower()]
-        
-        return filtered
+            filters['url_like'] = search_term
+        return filters
     
-    def update_stats_dashboard(self, history):
-        """Update statistics dashboard with current data"""
-        if not history:
+    def update_stats_dashboard(self, stats):
+        """Update statistics dashboard from a get_history_stats-style counter dict"""
+        total = stats['total']
+        if not total:
             return
-            
-        total = len(history)
-        working = sum(1 for t in history if t.alive)
-        dead = total - working
-        
-        # Calculate average success rate
-        total_checks = sum(t.check_count for t in history)
-        successful_checks = sum(t.success_count for t in history)
-        avg_success = (successful_checks / total_checks * 100) if total_checks > 0 else 0
-        
-        # Reliability breakdown
-        high_rel = sum(1 for t in history if t.check_count >= 3 and (t.success_count / t.check_count) >= 0.9)
-        medium_rel = sum(1 for t in history if t.check_count >= 3 and 0.7 <= (t.success_count / t.check_count) < 0.9)
-        low_rel = sum(1 for t in history if t.check_count >= 3 and (t.success_count / t.check_count) < 0.7)
+        working = stats['working']
+        total_checks = stats['total_checks']
+        avg_success = (stats['successful_checks'] / total_checks * 100) if total_checks > 0 else 0
         
         # Update labels
         self.total_label.config(text=f"Total: {total}")
         self.working_label.config(text=f"Working: {working}")
-        self.dead_label.config(text=f"Dead: {dead}")
+        self.dead_label.config(text=f"Dead: {total - working}")
         self.success_label.config(text=f"Avg Success: {avg_success:.1f}%")
-        self.reliability_label.config(text=f"High Rel: {high_rel}")
-        self.medium_rel_label.config(text=f"Med Rel: {medium_rel}")
-        self.low_rel_label.config(text=f"Low Rel: {low_rel}")
+        self.reliability_label.config(text=f"High Rel: {stats['high_rel']}")
+        self.medium_rel_label.config(text=f"Med Rel: {stats['medium_rel']}")
+        self.low_rel_label.config(text=f"Low Rel: {stats['low_rel']}")
     
     # ===== FILTER AND SEARCH METHODS =====
     
@@ -411,7 +585,14 @@ class HistoryView:
         self.refresh_history()
     
     def apply_search(self, event=None):
-        """Apply search filter"""
+        """Apply search filter (debounced so a burst of typing refreshes once)"""
+        if self._search_job is not None:
+            self.tab.after_cancel(self._search_job)
+        self._search_job = self.tab.after(SEARCH_DEBOUNCE_MS, self._do_search_refresh)
+    
+    def _do_search_refresh(self):
+        """Run the refresh scheduled by apply_search"""
+        self._search_job = None
         self.refresh_history()
     
     def show_reliable(self):
@@ -421,22 +602,12 @@ class HistoryView:
     
     def show_favorites(self):
         """Show favorite trackers"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         favorites = self.controller.get_favorites()
-        for tracker in favorites:
-            success_rate = (tracker.success_count / tracker.check_count * 100) if tracker.check_count > 0 else 0
-            
-            self.tree.insert('', 'end', values=(
-                tracker.url,
-                "✅ Working" if tracker.alive else "❌ Dead",
-                f"{tracker.response_time:.2f}s" if tracker.response_time else "N/A",
-                tracker.last_checked[:19] if tracker.last_checked else "Never",
-                f"{success_rate:.1f}%",
-                tracker.check_count,
-                "Favorite"
-            ))
+        rows = [(self._row_iid(t), _format_favorite_row(t.url, t.alive, t.check_count, t.success_count,
+                                                         t.response_time, t.last_checked))
+                for t in favorites]
+        
+        self.window.set_rows(rows)
     
     # ===== CONTEXT MENU AND INTERACTION METHODS =====
     
@@ -445,6 +616,11 @@ class HistoryView:
         item = self.tree.identify_row(event.y)
         if item:
             self.tree.selection_set(item)
+            # Reuse the single menu built in setup_gui; only the label changes per row
+            values = self.tree.item(item, 'values')
+            url = values[0] if values else ''
+            label = f"Validate {url[:30]}..." if len(url) > 30 else f"Validate {url}" if url else "Validate Again"
+            self.context_menu.entryconfig(VALIDATE_MENU_INDEX, label=label)
             self.context_menu.post(event.x_root, event.y_root)
     
     def add_selected_to_favorites(self):
@@ -484,7 +660,7 @@ class HistoryView:
         """Clear all history (with confirmation)"""
         if messagebox.askyesno("Clear History", "Are you sure you want to clear all history? This cannot be undone."):
             messagebox.showinfo("Clear History", "History clearance would be implemented here")
-            self.refresh_history()
+            self.force_refresh()
     
     def on_double_click(self, event):
         """Add double-clicked tracker to favorites"""
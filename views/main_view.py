@@ -3,14 +3,151 @@ from tkinter import ttk, scrolledtext, messagebox, filedialog
 import logging
 import time
 from datetime import datetime
-import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from models.tracker_models import Tracker
-from typing import Callable, Any, List
+from typing import Callable, Any, Dict, List
 from controllers.main_controller import MainController
 from views.history_view import HistoryView
+from views.virtual_tree import VirtualTreeWindow
 
 logger = logging.getLogger(__name__)
 
+# pyperclip is optional - large clipboard copies skip the Tcl string conversion through it
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
+# Notebook tab order; bodies are built on first display by MainView._ensure_tab_built
+DUPLICATE_TAB, VALIDATION_TAB, RESULTS_TAB, HISTORY_TAB = range(4)
+_TAB_TITLES = ("1. Find Duplicates", "2. Validate Trackers", "3. Export Results", "4. History & Analytics")
+
+# tk.Menu options applied by MainView._make_menu and apply_menu_theme
+_MENU_DARK = {"background": "#1a1a1a", "foreground": "#e8e8e8", "activebackground": "#505050",
+              "activeforeground": "#e8e8e8", "selectcolor": "#e8e8e8", "relief": "flat", "bd": 0}
+_MENU_LIGHT = {"background": "#f5f5f5", "foreground": "#333333", "activebackground": "#e0e0e0",
+               "activeforeground": "#333333", "selectcolor": "#333333", "relief": "flat", "bd": 0}
+
+# Buffered validation results are flushed into the text areas this often (ms)
+RESULT_FLUSH_MS = 100
+# Result line formats: with and without a response time (url, [seconds,] interface suffix)
+_LINE_OK_TIMED = "✅ %s (%.2fs)%s\n"
+_LINE_OK = "✅ %s%s\n"
+_LINE_BAD_TIMED = "❌ %s (%.2fs)%s\n"
+_LINE_BAD = "❌ %s%s\n"
+# Minimum seconds between auto-scroll see(END) calls on the result areas (~10 Hz)
+SCROLL_MIN_INTERVAL = 0.1
+# Minimum seconds between progress bar updates (~20 Hz); 100% always gets through
+PROGRESS_MIN_INTERVAL = 0.05
+
+# Loaded tracker files are read and inserted into the input area in chunks of this many characters
+LOAD_CHUNK_CHARS = 65536
+# Read buffer for loaded tracker files (bytes)
+LOAD_BUFFER_SIZE = 1 << 20
+# Long line lists are joined/inserted into (and read back from) text areas this many lines at a time
+INSERT_CHUNK_LINES = 1000
+# Clipboard payloads at least this long (characters) go through pyperclip when available
+CLIPBOARD_DIRECT_MIN_CHARS = 1 << 20
+# Exports go through a buffer this large (bytes), written in slices of EXPORT_CHUNK_CHARS
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_CHUNK_CHARS = 65536
+
+# (bg, fg, text_bg, text_fg, status_bg, status_fg) passed to MainView.apply_colors
+_DARK_PALETTE = ("#1a1a1a", "#e8e8e8", "#2a2a2a", "#ffffff", "#2a2a2a", "#e8e8e8")
+_LIGHT_PALETTE = ("#f5f5f5", "#333333", "#ffffff", "#000000", "#e0e0e0", "#333333")
+
+# Widgets themed per notebook tab by MainView._theme_tab, by attribute name
+_TAB_TEXT_WIDGETS = {
+    DUPLICATE_TAB: ('input_text', 'unique_text'),
+    VALIDATION_TAB: ('working_text', 'dead_text'),
+}
+_TAB_SPECIAL_LABELS = {
+    DUPLICATE_TAB: ('input_counter', 'unique_counter', 'stats_label', 'input_header', 'results_header_label'),
+    VALIDATION_TAB: ('wan_ip_value', 'wan_ip_label', 'interface_status', 'working_label', 'dead_label',
+                     'validation_stats', 'progress_label', 'timer_label', 'interface_label'),
+    RESULTS_TAB: ('preview_info',),
+}
+_EMPHASIS_LABELS = frozenset(('wan_ip_value', 'timer_label', 'validation_stats'))
+_MUTED_LABELS = frozenset(('input_counter', 'unique_counter', 'preview_info'))
+_HEADER_LABELS = frozenset(('interface_label', 'wan_ip_label', 'input_header', 'results_header_label'))
+
+# ttk style tables applied by MainView.apply_ttk_styles, one configure() per entry
+_STYLE_DARK = {
+    ".": {"background": "#1a1a1a", "foreground": "#e8e8e8", "fieldbackground": "#2a2a2a",
+          "selectbackground": "#404040", "selectforeground": "#e8e8e8", "troughcolor": "#404040"},
+    "TFrame": {"background": "#1a1a1a"},
+    "TLabel": {"background": "#1a1a1a", "foreground": "#e8e8e8"},
+    "TLabelframe": {"background": "#1a1a1a", "foreground": "#e8e8e8", "bordercolor": "#404040",
+                    "darkcolor": "#1a1a1a", "lightcolor": "#1a1a1a", "relief": "solid"},
+    "TLabelframe.Label": {"background": "#1a1a1a", "foreground": "#e8e8e8",
+                          "font": ("Arial", 10, "bold")},
+    "TButton": {"background": "#404040", "foreground": "#e8e8e8", "focuscolor": "#1a1a1a",
+                "borderwidth": 1, "relief": "raised"},
+    "TNotebook": {"background": "#1a1a1a"},
+    "TNotebook.Tab": {"background": "#404040", "foreground": "#e8e8e8", "focuscolor": "#1a1a1a",
+                      "padding": [10, 2]},
+    "Horizontal.TProgressbar": {"background": "#0078d7", "troughcolor": "#1a1a1a",
+                                "bordercolor": "#1a1a1a", "darkcolor": "#0078d7",
+                                "lightcolor": "#0078d7"},
+    "TCombobox": {"fieldbackground": "#2a2a2a", "background": "#2a2a2a", "foreground": "#e8e8e8",
+                  "selectbackground": "#404040", "selectforeground": "#e8e8e8",
+                  "arrowcolor": "#e8e8e8", "bordercolor": "#404040", "focuscolor": "#404040"},
+    "Vertical.TScrollbar": {"background": "#404040", "troughcolor": "#1a1a1a",
+                            "bordercolor": "#1a1a1a", "arrowcolor": "#e8e8e8",
+                            "darkcolor": "#404040", "lightcolor": "#404040"},
+    "Horizontal.TScrollbar": {"background": "#404040", "troughcolor": "#1a1a1a",
+                              "bordercolor": "#1a1a1a", "arrowcolor": "#e8e8e8",
+                              "darkcolor": "#404040", "lightcolor": "#404040"},
+    "TRadiobutton": {"background": "#1a1a1a", "foreground": "#e8e8e8",
+                     "indicatorcolor": "#1a1a1a", "indicatorrelief": "raised"},
+    "Treeview": {"background": "#2a2a2a", "fieldbackground": "#2a2a2a", "foreground": "#e8e8e8"},
+    "Treeview.Heading": {"background": "#404040", "foreground": "#e8e8e8"},
+}
+_STYLE_MAP_DARK = {
+    "TButton": {"background": [('active', '#505050'), ('pressed', '#606060')],
+                "foreground": [('active', '#e8e8e8'), ('pressed', '#e8e8e8')],
+                "relief": [('pressed', 'sunken')]},
+    "TNotebook.Tab": {"background": [('selected', '#505050'), ('active', '#484848')],
+                      "foreground": [('selected', '#e8e8e8'), ('active', '#e8e8e8')]},
+    "TCombobox": {"fieldbackground": [('readonly', '#2a2a2a')],
+                  "selectbackground": [('readonly', '#404040')],
+                  "background": [('readonly', '#2a2a2a')]},
+    "Vertical.TScrollbar": {"background": [('active', '#505050')]},
+    "Horizontal.TScrollbar": {"background": [('active', '#505050')]},
+    "TRadiobutton": {"background": [('active', '#1a1a1a')],
+                     "foreground": [('active', '#e8e8e8')]},
+    "Treeview": {"background": [('selected', '#0078d7')],
+                 "foreground": [('selected', '#ffffff')]},
+    "Treeview.Heading": {"background": [('active', '#505050')]},
+}
+_STYLE_LIGHT = {
+    ".": {"background": "#f5f5f5", "foreground": "#333333"},
+    "TFrame": {"background": "#f5f5f5"},
+    "TLabel": {"background": "#f5f5f5", "foreground": "#333333"},
+    "TLabelframe": {"background": "#f5f5f5", "foreground": "#333333"},
+    "TLabelframe.Label": {"background": "#f5f5f5", "foreground": "#333333"},
+    "TButton": {"background": "#f5f5f5", "foreground": "#333333"},
+    "TNotebook": {"background": "#f5f5f5"},
+    "TNotebook.Tab": {"background": "#f5f5f5", "foreground": "#333333"},
+    "Horizontal.TProgressbar": {"background": "#0078d7", "troughcolor": "#f5f5f5"},
+    "TCombobox": {"fieldbackground": "#f5f5f5", "background": "#f5f5f5", "foreground": "#333333"},
+    "Vertical.TScrollbar": {"background": "#f5f5f5", "troughcolor": "#e0e0e0"},
+    "Horizontal.TScrollbar": {"background": "#f5f5f5", "troughcolor": "#e0e0e0"},
+    "Treeview": {"background": "#ffffff", "fieldbackground": "#ffffff", "foreground": "#000000"},
+    "Treeview.Heading": {"background": "#e0e0e0", "foreground": "#333333"},
+}
+_STYLE_MAP_LIGHT = {
+    "TButton": {"background": [('active', '#e0e0e0'), ('pressed', '#d0d0d0')],
+                "foreground": [('active', '#333333'), ('pressed', '#333333')]},
+    "TNotebook.Tab": {"background": [('selected', '#e0e0e0'), ('active', '#f0f0f0')],
+                      "foreground": [('selected', '#333333'), ('active', '#333333')]},
+    "Treeview": {"background": [('selected', '#0078d7')],
+                 "foreground": [('selected', '#ffffff')]},
+    "Treeview.Heading": {"background": [('active', '#d0d0d0')]},
+}
+
 class MainView:
     def __init__(self, root, controller: MainController):
         self.root = root
@@ -22,11 +159,77 @@ class MainView:
         self.auto_scroll = self.controller.config.get("gui.auto_scroll", True)
         
         # Cache for efficient theming
-        self._label_widgets: List[tk.Label] = []
+        # Labels per notebook tab index
+        self._tab_labels: Dict[int, List[tk.Label]] = {}
+        self._dirty_tabs = set()  # built tabs still waiting for the current palette
+        self._tab_text_widgets: Dict[int, tuple] = {}  # filled as each tab is built
+        self._style = ttk.Style()
+        self._last_ttk_mode = None  # dark mode flag last pushed to self._style
+        self._theme_busy = False
+        self._palette = None  # (bg, fg, text_bg, text_fg) of the last theme pass, for late-built tabs
+        # toggle_theme bumps _theme_version; the idle pass only re-themes when it moved
+        self._theme_version = 0
+        self._applied_theme_version = -1
+        
+        # Network probes (WAN IP, interface test) run here instead of on the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-io")
+        self._io_futures = set()  # not yet finished, so quit can cancel the queued ones
+        self._wan_check_inflight = False
+        self._wan_check_after_id = None  # pending debounced check from on_interface_selected
+        self._wan_recheck = False  # a check was requested while one was in flight
+        self._interface_test_inflight = False
+        # Formatted interface choices; _iface_cache_key is the last enumerated tuple
+        self._iface_cache_key = None
+        self._iface_names = ["Auto (default)"]
+        self._iface_display_to_name = {"Auto (default)": None}
+        # Keep-alive session reused by test_interface; rebuilt when the interface changes
+        self._probe_session = None
+        self._probe_session_iface = None
+        
+        # Widgets of lazily built tabs; None until _ensure_tab_built creates them
+        self.interface_label = self.interface_var = self.interface_combo = None
+        self.interface_status = self.wan_ip_label = self.wan_ip_value = None
+        self.progress = self.progress_label = self.timer_label = self.validation_stats = None
+        self.validate_btn = self.stop_btn = None
+        self.working_label = self.dead_label = self.working_text = self.dead_text = None
+        self.preview_info = self.preview_tree = self.preview_window = None
+        self.history_view = None
+        
+        # Formatted result lines buffered by append_tracker_result until the next flush
+        self._working_buffer: List[str] = []
+        self._dead_buffer: List[str] = []
+        self._flush_after_id = None
+        self._interface_suffix = ""  # " [via <iface>]" computed once per validation run
+        self._last_see = 0.0
+        self._working_count = 0
+        self._dead_count = 0
+        self._shown_counts = (0, 0)  # counts currently on the counter labels
+        # Rows on screen in the result areas, so a re-run only rewrites lines that changed
+        self._working_rows: List[str] = []  # URLs in display order, including buffered lines
+        self._dead_rows: List[str] = []
+        self._row_lines: Dict[str, tuple] = {}  # url -> (alive, line) as shown
+        self._row_pos: Dict[str, int] = {}  # url -> 0-based line number in its area
+        self._row_replacements: List[str] = []  # URLs whose line is rewritten in place at the next flush
+        self._row_removals: List[tuple] = []  # (alive, pos) lines deleted at the next flush
+        self._run_seen = set()  # URLs with a result in the current run
+        # Latest rate-limited progress, applied by the same flush
+        self._pending_progress = None
+        self._last_progress_ts = 0.0
+        self._last_pct_logged = -1
         
         # Timer state management
         self._timer_running = False
         self._timer_id = None
+        self._last_elapsed_sec = -1
+        
+        # Load/export file I/O and preview formatting run here; one worker keeps them in order
+        self._file_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-file")
+        # Chunked file load state; _load_file is only touched on the file worker
+        self._load_file = None
+        self._load_path = None
+        self._load_token = None  # identity of the current load, None when idle
+        self._preview_token = None  # identity of the latest preview request
+        self._notice = None  # non-modal completion notice
         
         self.setup_gui()
         self.setup_bindings()
@@ -52,21 +255,54 @@ class MainView:
         
         self.create_menu_bar()
 
-        # Create notebook for tabs
+        # Create notebook for tabs; packed once below, after its first tab is built
         self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Setup tabs
-        self.setup_duplicate_tab()
-        self.setup_validation_tab()
-        self.setup_results_tab()
-        self.setup_history_tab()
+        # Export format outlives the results tab widgets (menu/hotkey exports use it)
+        self.export_format = tk.StringVar(value="txt")
+        
+        # Empty tab frames keep the tab strip complete; bodies are built on first display
+        self._tab_builders = (self.setup_duplicate_tab, self.setup_validation_tab,
+                              self.setup_results_tab, self.setup_history_tab)
+        self._tab_frames = []
+        self._tab_built = [False] * len(_TAB_TITLES)
+        for title in _TAB_TITLES:
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=title)
+            self._tab_frames.append(tab)
+        self._ensure_tab_built(DUPLICATE_TAB)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_shown)
         
         # Status bar at bottom
         self.setup_status_bar()
+        
+        # One geometry pass for the whole initial tree
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+
+    def _ensure_tab_built(self, index):
+        """Build a notebook tab's widgets the first time they are needed"""
+        if self._tab_built[index]:
+            return
+        self._tab_built[index] = True
+        tab = self._tab_frames[index]
+        self._tab_builders[index](tab)
+        self._tab_text_widgets[index] = tuple(
+            getattr(self, name) for name in _TAB_TEXT_WIDGETS.get(index, ()))
+        
+        # Built after the last theme pass: theme it when it is shown
+        if self._palette is not None:
+            self._dirty_tabs.add(index)
+
+    def _on_tab_shown(self, event=None):
+        """<<NotebookTabChanged>>: materialize and theme the newly selected tab"""
+        index = self.notebook.index('current')
+        self._ensure_tab_built(index)
+        self._theme_tab(index)
 
-        # Collect all labels for efficient theming
-        self._collect_labels(self.root)
+    def _select_tab(self, index):
+        """Build (if needed) and switch to a notebook tab"""
+        self._ensure_tab_built(index)
+        self.notebook.select(index)
 
     def setup_status_bar(self):
         """Add a status bar at the bottom of the window"""
@@ -77,13 +313,9 @@ class MainView:
         self.status_label = tk.Label(self.status_frame, textvariable=self.status_var, 
                                    relief='sunken', anchor='w', font=("Arial", 9))
         self.status_label.pack(fill='x')
-        
-        self._label_widgets.append(self.status_label)
 
-    def setup_duplicate_tab(self):
+    def setup_duplicate_tab(self, tab):
         """Setup duplicate detection tab with DARK MODE READY layout"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="1. Find Duplicates")
         
         # Input area - Enhanced for dark mode with explicit styling
         input_frame = ttk.LabelFrame(tab, text="Input Trackers", padding=10)
@@ -144,19 +376,19 @@ class MainView:
                                 font=("Arial", 10, "bold"))
         self.stats_label.pack(anchor='w')
 
-    def setup_validation_tab(self):
+    def setup_validation_tab(self, tab):
         """Setup validation tab with DARK MODE READY controls"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="2. Validate Trackers")
         
-        # Create a main frame with better organization
+        # Create a main frame with better organization: one grid column, results row stretches
         main_frame = ttk.Frame(tab)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(2, weight=1)
         main_frame.pack(fill='both', expand=True, padx=5, pady=5)
         
         # Network Interface section (Linux only) - Enhanced for dark mode
         if self.controller.is_linux_system():
             interface_frame = ttk.LabelFrame(main_frame, text="Network Interface (Linux Only)", padding=10)
-            interface_frame.pack(fill='x', pady=(0, 10))
+            interface_frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
             
             # Interface selection
             self.interface_label = tk.Label(interface_frame, text="Bind to interface:", font=("Arial", 10))
@@ -166,13 +398,11 @@ class MainView:
             interface_select_frame.pack(fill='x', pady=5)
             
             self.interface_var = tk.StringVar(value="Auto (default)")
-            interfaces = self.controller.get_network_interfaces()
-            interface_names = ["Auto (default)"] + [f"{i['name']} ({i['ip']}) - {i['type']}" for i in interfaces]
             
             # Combobox with enhanced styling for dark mode
             self.interface_combo = ttk.Combobox(interface_select_frame, 
                                             textvariable=self.interface_var,
-                                            values=interface_names,
+                                            values=self._iface_names,
                                             state="readonly",
                                             width=50,
                                             font=("Arial", 9))
@@ -210,12 +440,14 @@ class MainView:
             self.interface_status.pack(side='right')
             
             # Update status when interface is selected
-            if hasattr(self, 'interface_combo'):
-                self.interface_combo.bind('<<ComboboxSelected>>', self.on_interface_selected)
+            self.interface_combo.bind('<<ComboboxSelected>>', self.on_interface_selected)
+            
+            # Fill the combobox once enumeration finishes on a worker
+            self._submit_interface_scan(refresh=False, announce=False)
         
         # Control section - middle section
         control_frame = ttk.LabelFrame(main_frame, text="Validation Control", padding=10)
-        control_frame.pack(fill='x', pady=(0, 10))
+        control_frame.grid(row=1, column=0, sticky='ew', pady=(0, 10))
         
         ttk.Label(control_frame, text="Validate unique trackers from previous step:").pack(anchor='w', pady=(0, 10))
         
@@ -248,9 +480,9 @@ class MainView:
         self.validation_stats = tk.Label(stats_frame, text="Working: 0 | Dead: 0", font=("Arial", 9))
         self.validation_stats.pack(side='right')
         
-        # Results area - bottom section - FIXED VERSION (no grid/pack mixing)
+        # Results area - bottom section, grid row 2 (main_frame children are all gridded)
         results_frame = ttk.LabelFrame(main_frame, text="Validation Results", padding=10)
-        results_frame.pack(fill='both', expand=True)
+        results_frame.grid(row=2, column=0, sticky='nsew')
         
         # Results header with counters
         results_header = ttk.Frame(results_frame)
@@ -262,28 +494,30 @@ class MainView:
         self.dead_label = tk.Label(results_header, text="Dead Trackers: 0")
         self.dead_label.pack(side='right')
         
-        # Text areas container
+        # Text areas container: two equal grid columns
         text_container = ttk.Frame(results_frame)
+        text_container.columnconfigure((0, 1), weight=1, uniform='results')
+        text_container.rowconfigure(0, weight=1)
         text_container.pack(fill='both', expand=True)
         
         # Working trackers - left side
         working_container = ttk.Frame(text_container)
-        working_container.pack(side='left', fill='both', expand=True, padx=(0, 2))
+        working_container.grid(row=0, column=0, sticky='nsew', padx=(0, 2))
         
-        self.working_text = scrolledtext.ScrolledText(working_container, height=10, wrap=tk.WORD)
+        self.working_text = scrolledtext.ScrolledText(working_container, height=10, wrap=tk.WORD,
+                                                      state='disabled')
         self.working_text.pack(fill='both', expand=True, padx=5, pady=5)
         
         # Dead trackers - right side
         dead_container = ttk.Frame(text_container)
-        dead_container.pack(side='right', fill='both', expand=True, padx=(2, 0))
+        dead_container.grid(row=0, column=1, sticky='nsew', padx=(2, 0))
         
-        self.dead_text = scrolledtext.ScrolledText(dead_container, height=10, wrap=tk.WORD)
+        self.dead_text = scrolledtext.ScrolledText(dead_container, height=10, wrap=tk.WORD,
+                                                   state='disabled')
         self.dead_text.pack(fill='both', expand=True, padx=5, pady=5)
 
-    def setup_results_tab(self):
+    def setup_results_tab(self, tab):
         """Setup results tab with enhanced export options"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="3. Export Results")
         
         # Export controls
         export_frame = ttk.LabelFrame(tab, text="Export Options", padding=10)
@@ -295,7 +529,6 @@ class MainView:
         format_frame = ttk.Frame(export_frame)
         format_frame.pack(fill='x', pady=5)
         
-        self.export_format = tk.StringVar(value="txt")
         ttk.Radiobutton(format_frame, text="Text (TXT)", variable=self.export_format, value="txt").pack(side='left', padx=(0, 10))
         ttk.Radiobutton(format_frame, text="JSON", variable=self.export_format, value="json").pack(side='left', padx=(0, 10))
         ttk.Radiobutton(format_frame, text="CSV", variable=self.export_format, value="csv").pack(side='left', padx=(0, 10))
@@ -324,71 +557,92 @@ class MainView:
         self.preview_info = tk.Label(preview_header, text="No data to preview", font=("Arial", 9), fg="gray")
         self.preview_info.pack(side='right')
         
-        self.preview_text = scrolledtext.ScrolledText(preview_frame, height=15, wrap=tk.WORD)
-        self.preview_text.pack(fill='both', expand=True)
+        preview_body = ttk.Frame(preview_frame)
+        preview_body.pack(fill='both', expand=True)
+        self.preview_tree = ttk.Treeview(preview_body, columns=('line',), show='headings',
+                                         height=15, selectmode='browse')
+        self.preview_tree.heading('line', text='Content', anchor='w')
+        self.preview_tree.column('line', anchor='w', stretch=True)
+        preview_scrollbar = ttk.Scrollbar(preview_body, orient='vertical')
+        preview_scrollbar.pack(side='right', fill='y')
+        self.preview_tree.pack(side='left', fill='both', expand=True)
+        
+        # Only the lines in view are inserted, so a huge preview costs the same as a short one
+        self.preview_window = VirtualTreeWindow(self.preview_tree, preview_scrollbar, self._render_preview_rows)
 
-    def setup_history_tab(self):
+    def setup_history_tab(self, tab):
         """Setup history and analytics tab"""
-        self.history_view = HistoryView(self.notebook, self.controller)
-        self.notebook.add(self.history_view.tab, text="4. History & Analytics")
+        self.history_view = HistoryView(tab, self.controller)
+        self.history_view.tab.pack(fill='both', expand=True)
 
     def setup_bindings(self):
         """Setup event bindings and keyboard shortcuts"""
         # Always keep essential safety and help bindings
-        self.root.bind('<Control-x>', lambda e: self.quit_application())  # Nano-style quit only
-        self.root.bind('<Escape>', lambda e: self.on_stop_validation() if hasattr(self, 'stop_btn') and self.stop_btn['state'] == 'normal' else None)
-        self.root.bind('<F1>', lambda e: self.show_help())  # F1 help always available
+        self.root.bind('<Control-x>', self._on_ctrl_x)  # Nano-style quit only
+        self.root.bind('<Escape>', self._on_escape)
+        self.root.bind('<F1>', self._on_f1)  # F1 help always available
         self.root.protocol("WM_DELETE_WINDOW", self.quit_application)
         
         # Only setup convenience hotkeys if enabled in config
         if self.controller.config.get("gui.enable_hotkeys", False):
             # Ctrl+D to find duplicates
-            self.root.bind('<Control-d>', lambda e: self.on_find_duplicates())
+            self.root.bind('<Control-d>', self._on_ctrl_d)
             
             # Ctrl+V to validate
-            self.root.bind('<Control-v>', lambda e: self.on_start_validation())
+            self.root.bind('<Control-v>', self._on_ctrl_v)
             
             # Ctrl+T to toggle theme
-            self.root.bind('<Control-t>', lambda e: self.toggle_theme())
+            self.root.bind('<Control-t>', self._on_ctrl_t)
             
             # Ctrl+S to save/export
-            self.root.bind('<Control-s>', lambda e: self.on_export_file())
+            self.root.bind('<Control-s>', self._on_ctrl_s)
             
             # Ctrl+Shift+T for table copy
-            self.root.bind('<Control-Shift-T>', lambda e: self.copy_as_table())
+            self.root.bind('<Control-Shift-T>', self._on_ctrl_shift_t)
             
             logger.info("Hotkeys enabled: Ctrl+D, Ctrl+V, Ctrl+T, Ctrl+S, Ctrl+Shift+T")
         else:
             logger.info("Hotkeys disabled (F1 help and Ctrl-X quit still available)")
 
+    # ===== KEYBOARD SHORTCUT HANDLERS =====
+
+    def _on_ctrl_x(self, event):
+        self.quit_application()
+
+    def _on_escape(self, event):
+        btn = self.stop_btn
+        # cget returns a Tcl_Obj on some Tk builds; compare its string form
+        if btn is not None and str(btn.cget('state')) == 'normal':
+            self.on_stop_validation()
+
+    def _on_f1(self, event):
+        self.show_help()
+
+    def _on_ctrl_d(self, event):
+        self.on_find_duplicates()
+
+    def _on_ctrl_v(self, event):
+        self.on_start_validation()
+
+    def _on_ctrl_t(self, event):
+        self.toggle_theme()
+
+    def _on_ctrl_s(self, event):
+        self.on_export_file()
+
+    def _on_ctrl_shift_t(self, event):
+        self.copy_as_table()
+
     # ===== MENU AND WINDOW MANAGEMENT METHODS =====
 
     def create_menu_bar(self):
         """Create the application menu bar with enhanced options"""
-        menubar = tk.Menu(self.root)
+        self._all_menus: List[tk.Menu] = []
+        menubar = self._make_menu(self.root)
         self.root.config(menu=menubar)
         
-        # Set menu colors based on current theme
-        bg_color = "#1a1a1a" if self.is_dark_mode else "#f5f5f5"
-        fg_color = "#e8e8e8" if self.is_dark_mode else "#333333"
-        active_bg = "#505050" if self.is_dark_mode else "#e0e0e0"
-        
-        # Configure main menu bar
-        menubar.configure(
-            background=bg_color,
-            foreground=fg_color,
-            activebackground=active_bg,
-            activeforeground=fg_color,
-            relief="flat",
-            bd=0
-        )
-        
         # File menu
-        file_menu = tk.Menu(menubar, tearoff=0,
-                        bg=bg_color,
-                        fg=fg_color,
-                        activebackground=active_bg,
-                        activeforeground=fg_color)
+        file_menu = self._make_menu(menubar)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Load Trackers", command=self.on_load_file)
         file_menu.add_command(label="Export Results", command=self.on_export_file)
@@ -396,11 +650,7 @@ class MainView:
         file_menu.add_command(label="Exit", command=self.quit_application)
         
         # View menu
-        view_menu = tk.Menu(menubar, tearoff=0,
-                        bg=bg_color,
-                        fg=fg_color,
-                        activebackground=active_bg,
-                        activeforeground=fg_color)
+        view_menu = self._make_menu(menubar)
         menubar.add_cascade(label="View", menu=view_menu)
         view_menu.add_command(label="Toggle Theme", command=self.toggle_theme)
         
@@ -413,11 +663,7 @@ class MainView:
         )
         
         # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0,
-                            bg=bg_color,
-                            fg=fg_color,
-                            activebackground=active_bg,
-                            activeforeground=fg_color)
+        tools_menu = self._make_menu(menubar)
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="Clear All", command=self.on_clear_all)
         tools_menu.add_separator()
@@ -426,11 +672,7 @@ class MainView:
         tools_menu.add_command(label="Copy as Table", command=self.copy_as_table)
         
         # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0,
-                           bg=bg_color,
-                           fg=fg_color,
-                           activebackground=active_bg,
-                           activeforeground=fg_color)
+        help_menu = self._make_menu(menubar)
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Quick Help", command=self.show_help)
         help_menu.add_command(label="About", command=self.show_about)
@@ -444,6 +686,17 @@ class MainView:
             
             # Stop timer
             self.stop_timer()
+            self._cancel_file_load()
+            
+            # Drop queued network probes; running ones end within their request timeout
+            # (by hand: shutdown's cancel_futures needs Python 3.9)
+            for future in list(self._io_futures):
+                future.cancel()
+            self._io_pool.shutdown(wait=False)
+            # Let a running export and the load-file close finish
+            self._file_pool.shutdown(wait=False)
+            if not self._interface_test_inflight:
+                self._close_probe_session()
             
             # Force save using the correct method
             if hasattr(self.controller.config, '_save_config_immediate'):
@@ -522,276 +775,117 @@ Developed with Python and Tkinter"""
             if hasattr(self.controller.config, '_save_config_immediate'):
                 self.controller.config._save_config_immediate()
         
-        # Apply theme immediately
-        self.apply_theme()
+        # Apply theme on the next idle pass so rapid toggles collapse to one repaint
+        self._theme_version += 1
+        self.root.after_idle(self._maybe_apply_theme)
         self.update_status(f"Theme changed to {'Dark' if self.is_dark_mode else 'Light'} mode")
 
+    def _maybe_apply_theme(self):
+        """Apply the theme only if it changed since the last applied version"""
+        if self._applied_theme_version == self._theme_version:
+            return
+        self.apply_theme()
+
     def apply_theme(self):
         """Apply the current theme - ENHANCED DARK MODE CONTRAST"""
-        if self.is_dark_mode:
-            # Enhanced dark theme with better contrast
-            bg_color, fg_color = "#1a1a1a", "#e8e8e8"
-            text_bg, text_fg = "#2a2a2a", "#ffffff"  # Better contrast for text areas
-            status_bg, status_fg = "#2a2a2a", "#e8e8e8"
-            
-            # Enhanced color scheme for better visual hierarchy
-            self.dark_colors = {
-                'bg': bg_color,
-                'fg': fg_color,
-                'text_bg': text_bg,
-                'text_fg': text_fg,
-                'accent': "#0078d7",
-                'success': "#4CAF50",
-                'warning': "#FF9800",
-                'error': "#F44336"
-            }
-        else:
-            # Light theme
-            bg_color, fg_color = "#f5f5f5", "#333333"
-            text_bg, text_fg = "#ffffff", "#000000"
-            status_bg, status_fg = "#e0e0e0", "#333333"
-            
-            self.light_colors = {
-                'bg': bg_color,
-                'fg': fg_color,
-                'text_bg': text_bg,
-                'text_fg': text_fg,
-                'accent': "#0078d7",
-                'success': "#4CAF50",
-                'warning': "#FF9800",
-                'error': "#F44336"
-            }
-        
-        self.apply_colors(bg_color, fg_color, text_bg, text_fg, status_bg, status_fg)
+        self.apply_colors(*(_DARK_PALETTE if self.is_dark_mode else _LIGHT_PALETTE))
+        self._applied_theme_version = self._theme_version
 
     def apply_colors(self, bg_color, fg_color, text_bg, text_fg, status_bg, status_fg):
         """Apply colors to all widgets - HEAVILY OPTIMIZED"""
-        # Apply to root window
-        self.root.configure(bg=bg_color)
-        
-        # Apply to menu bar
-        self.apply_menu_theme(bg_color, fg_color)
-        
-        # Apply ttk styles first (global) - MAJOR PERFORMANCE BOOST
-        self.apply_ttk_styles(bg_color, fg_color)
-        
-        # Apply status bar
-        if hasattr(self, 'status_label') and self.status_label.winfo_exists():
+        self._palette = (bg_color, fg_color, text_bg, text_fg)
+        self._begin_bulk_theme()
+        try:
+            # Apply to root window
+            self.root.configure(bg=bg_color)
+            
+            # Apply to menu bar
+            self.apply_menu_theme(bg_color, fg_color)
+            
+            # Apply ttk styles first (global) - skipped when the mode is unchanged
+            self.apply_ttk_styles(bg_color, fg_color)
+            
+            # Apply status bar (its own colors, so it is not in the label cache)
             self.status_label.configure(bg=status_bg, fg=status_fg)
-        
-        # Apply to specific widgets (optimized)
-        self.apply_to_specific_widgets(bg_color, fg_color, text_bg, text_fg)
-        
-        # CRITICAL: Fix validation tab labels specifically
-        if self.is_dark_mode:
-            self._fix_validation_tab_labels(bg_color, fg_color)
+            
+            # Apply to specific widgets (optimized)
+            self.apply_to_specific_widgets(bg_color, fg_color, text_bg, text_fg)
+        finally:
+            self._end_bulk_theme()
 
-    def apply_menu_theme(self, bg_color, fg_color):
-        """Apply theme to the menu bar"""
+    def _begin_bulk_theme(self):
+        """Hold input and defer repaints while a theming pass reconfigures many widgets"""
         try:
-            menubar = self.root.cget("menu")
-            if menubar:
-                try:
-                    menubar.configure(
-                        background=bg_color,
-                        foreground=fg_color,
-                        activebackground="#505050" if self.is_dark_mode else "#e0e0e0",
-                        activeforeground=fg_color,
-                        relief="flat",
-                        bd=0
-                    )
-                except:
-                    pass
-                
-                for i in range(menubar.index("end") + 1):
-                    try:
-                        menu_name = menubar.entrycget(i, "menu")
-                        if menu_name:
-                            submenu = menubar.nametowidget(menu_name)
-                            submenu.configure(
-                                background=bg_color,
-                                foreground=fg_color,
-                                activebackground="#505050" if self.is_dark_mode else "#e0e0e0",
-                                activeforeground=fg_color,
-                                selectcolor=fg_color,
-                                relief="flat",
-                                bd=0
-                            )
-                    except:
-                        continue
-        except Exception as e:
-            logger.debug(f"Menu theming failed: {e}")
+            self.root.tk.call('tk', 'busy', 'hold', str(self.root))
+            self._theme_busy = True
+        except tk.TclError as e:
+            logger.debug(f"tk busy unavailable: {e}")
+
+    def _end_bulk_theme(self):
+        """Release the busy hold and flush all pending configure work as one paint"""
+        if self._theme_busy:
+            try:
+                self.root.tk.call('tk', 'busy', 'forget', str(self.root))
+            except tk.TclError as e:
+                logger.debug(f"tk busy forget failed: {e}")
+            self._theme_busy = False
+        self._refresh_all_ttk_widgets()
+
+    def _make_menu(self, parent, tearoff=0):
+        """Create a tk.Menu in the current palette and register it for re-theming"""
+        menu = tk.Menu(parent, tearoff=tearoff, **self._menu_options())
+        self._all_menus.append(menu)
+        return menu
+
+    def _menu_options(self):
+        """Menu color options for the current mode"""
+        return _MENU_DARK if self.is_dark_mode else _MENU_LIGHT
+
+    def apply_menu_theme(self, bg_color, fg_color):
+        """Apply theme to the menu bar and every menu created by _make_menu"""
+        options = self._menu_options()
+        for menu in self._all_menus:
+            try:
+                menu.configure(**options)
+            except tk.TclError as e:
+                logger.debug(f"Menu theming failed: {e}")
 
     def apply_ttk_styles(self, bg_color, fg_color):
-        """Apply styles to ttk widgets - COMPREHENSIVE DARK MODE FIX"""
-        style = ttk.Style()
+        """Apply the precomputed ttk style tables for the current mode"""
+        if self._last_ttk_mode == self.is_dark_mode:
+            return
         
         if self.is_dark_mode:
-            # DARK THEME - Enhanced with proper LabelFrame theming
-            style.configure(".", 
-                        background=bg_color, 
-                        foreground=fg_color,
-                        fieldbackground="#2a2a2a",
-                        selectbackground="#404040",
-                        selectforeground=fg_color,
-                        troughcolor="#404040")
-            
-            # Base styles
-            style.configure("TFrame", background=bg_color)
-            style.configure("TLabel", background=bg_color, foreground=fg_color)
-            
-            # CRITICAL FIX: LabelFrame theming for dark mode
-            style.configure("TLabelframe", 
-                        background=bg_color, 
-                        foreground=fg_color,
-                        bordercolor="#404040",  # Border color
-                        darkcolor=bg_color,
-                        lightcolor=bg_color,
-                        relief="solid")  # Explicit relief
-            
-            style.configure("TLabelframe.Label", 
-                        background=bg_color, 
-                        foreground=fg_color,
-                        font=("Arial", 10, "bold"))
-            
-            # Apply the style to ALL existing LabelFrames
-            self._refresh_all_label_frames()
-            
-            # Button styles
-            style.configure("TButton", 
-                        background="#404040", 
-                        foreground=fg_color,
-                        focuscolor=bg_color,
-                        borderwidth=1,
-                        relief="raised")
-            style.map("TButton",
-                    background=[('active', '#505050'), ('pressed', '#606060')],
-                    foreground=[('active', fg_color), ('pressed', fg_color)],
-                    relief=[('pressed', 'sunken')])
-            
-            # Notebook styles
-            style.configure("TNotebook", background=bg_color)
-            style.configure("TNotebook.Tab", 
-                        background="#404040", 
-                        foreground=fg_color,
-                        focuscolor=bg_color,
-                        padding=[10, 2])
-            style.map("TNotebook.Tab",
-                    background=[('selected', '#505050'), ('active', '#484848')],
-                    foreground=[('selected', fg_color), ('active', fg_color)])
-            
-            # Progress bar
-            style.configure("Horizontal.TProgressbar", 
-                        background="#0078d7",
-                        troughcolor=bg_color,
-                        bordercolor=bg_color,
-                        darkcolor="#0078d7",
-                        lightcolor="#0078d7")
-            
-            # Combobox styles
-            style.configure("TCombobox",
-                        fieldbackground="#2a2a2a",
-                        background="#2a2a2a", 
-                        foreground=fg_color,
-                        selectbackground="#404040",
-                        selectforeground=fg_color,
-                        arrowcolor=fg_color,
-                        bordercolor="#404040",
-                        focuscolor="#404040")
-            style.map("TCombobox",
-                    fieldbackground=[('readonly', '#2a2a2a')],
-                    selectbackground=[('readonly', '#404040')],
-                    background=[('readonly', '#2a2a2a')])
-            
-            # Scrollbar styles
-            style.configure("Vertical.TScrollbar",
-                        background="#404040",
-                        troughcolor=bg_color,
-                        bordercolor=bg_color,
-                        arrowcolor=fg_color,
-                        darkcolor="#404040",
-                        lightcolor="#404040")
-            style.configure("Horizontal.TScrollbar",
-                        background="#404040",
-                        troughcolor=bg_color,
-                        bordercolor=bg_color,
-                        arrowcolor=fg_color,
-                        darkcolor="#404040",
-                        lightcolor="#404040")
-            style.map("Vertical.TScrollbar",
-                    background=[('active', '#505050')])
-            style.map("Horizontal.TScrollbar",
-                    background=[('active', '#505050')])
-            
-            # Radiobutton styles
-            style.configure("TRadiobutton",
-                        background=bg_color,
-                        foreground=fg_color,
-                        indicatorcolor=bg_color,
-                        indicatorrelief="raised")
-            style.map("TRadiobutton",
-                    background=[('active', bg_color)],
-                    foreground=[('active', fg_color)])
-                    
+            styles, maps = _STYLE_DARK, _STYLE_MAP_DARK
         else:
-            # LIGHT THEME - Clean and professional
-            style.configure(".", background=bg_color, foreground=fg_color)
-            style.configure("TFrame", background=bg_color)
-            style.configure("TLabel", background=bg_color, foreground=fg_color)
-            
-            # Light theme LabelFrame
-            style.configure("TLabelframe", background=bg_color, foreground=fg_color)
-            style.configure("TLabelframe.Label", background=bg_color, foreground=fg_color)
-
-            # Button styles
-            style.configure("TButton", 
-                        background=bg_color, 
-                        foreground=fg_color)
-            style.map("TButton",
-                    background=[('active', '#e0e0e0'), ('pressed', '#d0d0d0')],
-                    foreground=[('active', fg_color), ('pressed', fg_color)])
-            
-            # Notebook styles
-            style.configure("TNotebook", background=bg_color)
-            style.configure("TNotebook.Tab", 
-                        background=bg_color, 
-                        foreground=fg_color)
-            style.map("TNotebook.Tab",
-                    background=[('selected', '#e0e0e0'), ('active', '#f0f0f0')],
-                    foreground=[('selected', fg_color), ('active', fg_color)])
-            
-            # Progress bar
-            style.configure("Horizontal.TProgressbar", 
-                        background="#0078d7",
-                        troughcolor=bg_color)
-            
-            # Combobox styles
-            style.configure("TCombobox", 
-                        fieldbackground=bg_color,
-                        background=bg_color,
-                        foreground=fg_color)
-            
-            # Scrollbar styles
-            style.configure("Vertical.TScrollbar",
-                        background=bg_color,
-                        troughcolor="#e0e0e0")
-            style.configure("Horizontal.TScrollbar",
-                        background=bg_color,
-                        troughcolor="#e0e0e0")
+            styles, maps = _STYLE_LIGHT, _STYLE_MAP_LIGHT
+        for name, options in styles.items():
+            self._style.configure(name, **options)
+        for name, options in maps.items():
+            self._style.map(name, **options)
         
-        # Force refresh of all ttk widgets
-        self._refresh_all_ttk_widgets()
+        # Apply the LabelFrame style to ALL existing LabelFrames
+        if self.is_dark_mode:
+            self._refresh_all_label_frames()
+        self._last_ttk_mode = self.is_dark_mode
 
     def apply_to_specific_widgets(self, bg_color, fg_color, text_bg, text_fg):
-        """Apply colors to specific widgets - COMPREHENSIVE DARK MODE FIX"""
-        # Enhanced text widget theming for dark mode
-        text_widgets = [
-            self.input_text, self.unique_text, self.working_text,
-            self.dead_text, self.preview_text
-        ]
+        """Theme the visible tab now; hidden tabs are themed when shown"""
+        self._dirty_tabs.update(i for i, built in enumerate(self._tab_built) if built)
+        self._theme_tab(self.notebook.index('current'))
+
+    def _theme_tab(self, index):
+        """Apply the current palette to one notebook tab if it is dirty"""
+        if index not in self._dirty_tabs:
+            return
+        self._dirty_tabs.discard(index)
+        bg_color, fg_color, text_bg, text_fg = self._palette
         
-        for widget in text_widgets:
-            if widget and widget.winfo_exists():
+        # Enhanced text widget theming for dark mode
+        text_colors = (self.is_dark_mode, text_bg, text_fg, fg_color)
+        for widget in self._tab_text_widgets.get(index, ()):
+            # Skip widgets already carrying this palette
+            if getattr(widget, '_tm_colors', None) != text_colors:
                 try:
                     # Enhanced dark mode text area styling
                     if self.is_dark_mode:
@@ -819,11 +913,27 @@ Developed with Python and Tkinter"""
                             relief="sunken",
                             borderwidth=1
                         )
+                    widget._tm_colors = text_colors
                 except Exception as e:
                     logger.debug(f"Could not theme text widget: {e}")
         
-        # Enhanced combobox theming for dark mode
-        if hasattr(self, 'interface_combo') and self.interface_combo.winfo_exists():
+        if index == VALIDATION_TAB:
+            self._theme_interface_combo(bg_color, fg_color)
+        
+        # Generic pass first so the special label colors below are not overwritten
+        self._theme_cached_labels(self._labels_for(index), bg_color, fg_color)
+        self._theme_all_special_labels(_TAB_SPECIAL_LABELS.get(index, ()), bg_color, fg_color)
+        
+        # History view theming
+        if index == HISTORY_TAB and self.history_view is not None:
+            try:
+                self.history_view.apply_theme(bg_color, fg_color, text_bg, text_fg)
+            except Exception as e:
+                logger.debug(f"Could not theme history view: {e}")
+
+    def _theme_interface_combo(self, bg_color, fg_color):
+        """Theme the interface combobox (validation tab, Linux only)"""
+        if self.interface_combo is not None:
             try:
                 if self.is_dark_mode:
                     self.interface_combo.configure(
@@ -839,171 +949,81 @@ Developed with Python and Tkinter"""
                     )
             except Exception as e:
                 logger.debug(f"Could not theme combobox: {e}")
-        
-        # ENHANCED: Comprehensive label theming - ADD RECURSIVE METHOD
-        self._theme_all_special_labels(bg_color, fg_color)
-        self._theme_all_labels_recursive(self.root, bg_color, fg_color)  # ADD THIS LINE
-        
-        # Enhanced frame theming for better visual hierarchy
-        try:
-            # Style the status bar differently in dark mode
-            if hasattr(self, 'status_label') and self.status_label.winfo_exists():
-                if self.is_dark_mode:
-                    self.status_label.configure(bg="#2a2a2a", fg="#e8e8e8")
-                else:
-                    self.status_label.configure(bg="#e0e0e0", fg="#333333")
-        except Exception as e:
-            logger.debug(f"Could not theme status bar: {e}")
-        
-        # History view theming
-        if hasattr(self, 'history_view'):
-            try:
-                self.history_view.apply_theme(bg_color, fg_color, text_bg, text_fg)
-            except Exception as e:
-                logger.debug(f"Could not theme history view: {e}")
 
-    def _theme_all_special_labels(self, bg_color, fg_color):
-        """Theme all special labels comprehensively"""
-        # Enhanced label theming for better contrast
-        special_labels = [
-            'wan_ip_value', 'wan_ip_label', 'interface_status', 'input_counter', 
-            'unique_counter', 'working_label', 'dead_label', 'validation_stats', 
-            'preview_info', 'stats_label', 'progress_label', 'timer_label',
-            'interface_label', 'input_header', 'results_header_label'  # ADDED THESE
-        ]
-        
-        for attr_name in special_labels:
-            if hasattr(self, attr_name):
-                label_widget = getattr(self, attr_name)
-                if label_widget and label_widget.winfo_exists():
-                    try:
-                        if self.is_dark_mode:
-                            # Special styling for important labels in dark mode
-                            if attr_name in ['wan_ip_value', 'timer_label', 'validation_stats']:
-                                label_widget.configure(bg=bg_color, fg="#ffffff", font=("Arial", 9, "bold"))
-                            elif attr_name in ['input_counter', 'unique_counter', 'preview_info']:
-                                label_widget.configure(bg=bg_color, fg="#cccccc", font=("Arial", 9))
-                            elif attr_name in ['interface_label', 'wan_ip_label', 'input_header', 'results_header_label']:
-                                # CRITICAL FIX: These are the white labels in both tabs
-                                label_widget.configure(bg=bg_color, fg=fg_color, font=("Arial", 10))
-                                logger.info(f"Themed {attr_name} label")
-                            else:
-                                label_widget.configure(bg=bg_color, fg=fg_color)
-                        else:
-                            label_widget.configure(bg=bg_color, fg=fg_color)
-                    except Exception as e:
-                        logger.debug(f"Could not theme label {attr_name}: {e}")
-        
-        # MANUALLY THEME SPECIFIC LABELS THAT ARE STILL WHITE
-        try:
-            # Theme the header labels in duplicate tab
-            if hasattr(self, 'input_header') and self.input_header.winfo_exists():
-                self.input_header.configure(bg=bg_color, fg=fg_color)
-            if hasattr(self, 'results_header_label') and self.results_header_label.winfo_exists():
-                self.results_header_label.configure(bg=bg_color, fg=fg_color)
-            
-            # CRITICAL: Directly theme the validation tab labels we know exist
-            validation_labels_to_fix = [
-                'interface_label', 'wan_ip_label'
-            ]
-            
-            for label_name in validation_labels_to_fix:
-                if hasattr(self, label_name):
-                    label = getattr(self, label_name)
-                    if label and label.winfo_exists():
-                        label.configure(bg=bg_color, fg=fg_color)
-                        logger.info(f"Directly themed {label_name}")
-                        
-        except Exception as e:
-            logger.debug(f"Could not theme specific headers: {e}")
+    def _theme_all_special_labels(self, attr_names, bg_color, fg_color):
+        """Theme the named special labels comprehensively"""
+        for attr_name in attr_names:
+            label_widget = getattr(self, attr_name, None)
+            if label_widget is None:
+                continue
+            try:
+                if not self.is_dark_mode:
+                    label_widget.configure(bg=bg_color, fg=fg_color)
+                # Special styling for important labels in dark mode
+                elif attr_name in _EMPHASIS_LABELS:
+                    label_widget.configure(bg=bg_color, fg="#ffffff", font=("Arial", 9, "bold"))
+                elif attr_name in _MUTED_LABELS:
+                    label_widget.configure(bg=bg_color, fg="#cccccc", font=("Arial", 9))
+                elif attr_name in _HEADER_LABELS:
+                    label_widget.configure(bg=bg_color, fg=fg_color, font=("Arial", 10))
+                else:
+                    label_widget.configure(bg=bg_color, fg=fg_color)
+            except tk.TclError as e:
+                # Destroyed widget: drop it from future theme passes
+                logger.debug(f"Could not theme label {attr_name}: {e}")
+                setattr(self, attr_name, None)
 
-    def _fix_validation_tab_labels(self, bg_color, fg_color):
-        """Manually fix specific labels in validation tab that remain white"""
-        try:
-            # Get the validation tab (tab index 1)
-            validation_tab = self.notebook.nametowidget(self.notebook.tabs()[1])
-            
-            # Find the main frame in validation tab
-            for child in validation_tab.winfo_children():
-                if isinstance(child, ttk.Frame):  # Main frame
-                    for main_child in child.winfo_children():
-                        # Look for Network Interface LabelFrame
-                        if (isinstance(main_child, ttk.LabelFrame) and 
-                            "Network Interface" in main_child.cget("text")):
-                            
-                            # Fix "Bind to interface:" label
-                            for frame_child in main_child.winfo_children():
-                                if isinstance(frame_child, tk.Label) and "Bind to interface:" in frame_child.cget("text"):
-                                    frame_child.configure(bg=bg_color, fg=fg_color)
-                                    logger.info("Fixed 'Bind to interface:' label")
-                                
-                                # Look for WAN IP LabelFrame inside the Network Interface frame
-                                elif isinstance(frame_child, ttk.Frame):
-                                    for sub_child in frame_child.winfo_children():
-                                        if isinstance(sub_child, ttk.LabelFrame) and "WAN IP" in sub_child.cget("text"):
-                                            # Fix labels inside WAN IP frame
-                                            for wan_child in sub_child.winfo_children():
-                                                if isinstance(wan_child, ttk.Frame):
-                                                    for label_child in wan_child.winfo_children():
-                                                        if isinstance(label_child, tk.Label) and "WAN IP:" in label_child.cget("text"):
-                                                            label_child.configure(bg=bg_color, fg=fg_color)
-                                                            logger.info("Fixed 'WAN IP:' label")
-            
-            # Alternative method: Directly target the specific label attributes we know exist
-            if hasattr(self, 'interface_label') and self.interface_label.winfo_exists():
-                self.interface_label.configure(bg=bg_color, fg=fg_color)
-                logger.info("Fixed interface_label via attribute")
-            
-            # Find and fix any WAN IP label
-            if hasattr(self, 'wan_ip_label') and self.wan_ip_label.winfo_exists():
-                self.wan_ip_label.configure(bg=bg_color, fg=fg_color)
-                logger.info("Fixed wan_ip_label via attribute")
-                
-        except Exception as e:
-            logger.debug(f"Could not fix validation tab labels: {e}")
+    def _labels_for(self, index):
+        """Cached labels of a notebook tab, collected on first use"""
+        labels = self._tab_labels.get(index)
+        if labels is None:
+            labels = self._tab_labels[index] = self._collect_labels(self._tab_frames[index])
+        return labels
 
-    def _theme_all_labels_recursive(self, parent, bg_color, fg_color):
-        """Recursively theme ALL labels in the entire application"""
-        try:
-            for child in parent.winfo_children():
-                # Theme regular tk Labels
-                if isinstance(child, tk.Label):
-                    try:
-                        child.configure(bg=bg_color, fg=fg_color)
-                    except Exception as e:
-                        logger.debug(f"Could not theme label {child}: {e}")
-                
-                # Recursively theme children
-                if hasattr(child, 'winfo_children'):
-                    self._theme_all_labels_recursive(child, bg_color, fg_color)
-                    
-        except Exception as e:
-            logger.debug(f"Error in recursive label theming: {e}")
+    def _theme_cached_labels(self, labels, bg_color, fg_color):
+        """Theme cached tk.Labels, compacting destroyed ones out of the list in place"""
+        colors = (bg_color, fg_color)
+        write = 0
+        for label in labels:
+            if getattr(label, '_tm_colors', None) != colors:
+                try:
+                    label.configure(bg=bg_color, fg=fg_color)
+                except tk.TclError as e:
+                    # Destroyed since collection: drop it from the cache
+                    logger.debug(f"Dropping label {label}: {e}")
+                    continue
+                label._tm_colors = colors
+            labels[write] = label
+            write += 1
+        del labels[write:]
 
-    def _collect_labels(self, parent):
-        """Collect all Label widgets for efficient theming"""
+    def _collect_labels(self, root):
+        """Collect all Label widgets below root with one winfo_children call per widget"""
+        labels = []
+        pending = deque([root])
         try:
-            for child in parent.winfo_children():
-                if child.winfo_class() == 'Label':
-                    self._label_widgets.append(child)
-                if child.winfo_children():
-                    self._collect_labels(child)
+            while pending:
+                kids = pending.popleft().winfo_children()
+                for child in kids:
+                    if child.winfo_class() == 'Label':
+                        labels.append(child)
+                pending.extend(kids)
         except Exception as e:
-            logger.debug(f"Could not collect labels from {parent}: {e}")
+            logger.debug(f"Could not collect labels from {root}: {e}")
+        return labels
 
     def _refresh_all_label_frames(self):
         """Refresh all LabelFrame widgets to apply new styles"""
+        pending = deque([self.root])
         try:
-            # Find and refresh all LabelFrame widgets
-            def refresh_widgets(parent):
-                for child in parent.winfo_children():
+            # Find and refresh all LabelFrame widgets, one winfo_children call per widget
+            while pending:
+                kids = pending.popleft().winfo_children()
+                for child in kids:
                     if isinstance(child, ttk.LabelFrame):
                         # Reconfigure the LabelFrame
                         child.configure(style='TLabelframe')
-                    if child.winfo_children():
-                        refresh_widgets(child)
-            
-            refresh_widgets(self.root)
+                pending.extend(kids)
         except Exception as e:
             logger.debug(f"Could not refresh LabelFrames: {e}")
 
@@ -1031,106 +1051,184 @@ Developed with Python and Tkinter"""
 
     def on_interface_selected(self, event):
         """Handle interface selection"""
-        selected = self.interface_var.get()
-        if selected != "Auto (default)":
-            interface_name = selected.split(' ')[0]
+        interface_name = self._selected_interface()
+        # Interface binding lives on the session's adapters, so drop the pooled one
+        if not self._interface_test_inflight:
+            self._close_probe_session()
+        if interface_name:
             self.interface_status.config(
                 text=f"Interface: {interface_name} ✅", 
                 fg="green"
             )
-            # Auto-check WAN IP when interface changes
-            self.root.after(500, self.check_wan_ip)
         else:
             self.interface_status.config(
                 text="Interface: Default", 
                 fg="gray"
             )
-            self.check_wan_ip()
+        
+        # Auto-check WAN IP once the selection settles
+        if self._wan_check_after_id is not None:
+            self.root.after_cancel(self._wan_check_after_id)
+        self._wan_check_after_id = self.root.after(500, self._debounced_check_wan_ip)
+
+    def _selected_interface(self):
+        """Interface name behind the combobox selection, or None for Auto"""
+        if self.interface_var is None:
+            return None
+        return self._iface_display_to_name.get(self.interface_var.get())
+
+    def _debounced_check_wan_ip(self):
+        """Run the WAN IP check scheduled by on_interface_selected"""
+        self._wan_check_after_id = None
+        self.check_wan_ip()
 
     def check_wan_ip(self):
-        """Check and display the current WAN IP with enhanced safety"""
-        def check():
-            try:
-                if hasattr(self, 'interface_var'):
-                    interface_name = None
-                    if self.interface_var.get() != "Auto (default)":
-                        interface_name = self.interface_var.get().split(' ')[0]
-                    
-                    self.controller.set_validation_interface(interface_name)
-                    external_ip = self.controller.validator.get_external_ip()
-                    
-                    # Enhanced safety check
-                    def update_ip():
-                        if hasattr(self, 'wan_ip_value') and self.wan_ip_value.winfo_exists():
-                            self.wan_ip_value.config(
-                                text=external_ip,
-                                fg="red" if "failed" in external_ip.lower() else "green"
-                            )
-                    
-                    self.safe_gui_update(update_ip)
-                    self.update_status(f"WAN IP: {external_ip}")
-            except Exception as e:
-                logger.error(f"Error checking WAN IP: {e}")
-                def show_error():
-                    if hasattr(self, 'wan_ip_value') and self.wan_ip_value.winfo_exists():
-                        self.wan_ip_value.config(text=f"Error: {e}", fg="red")
-                self.safe_gui_update(show_error)
+        """Check and display the current WAN IP on a worker thread"""
+        if self.interface_var is None:
+            return
+        if self._wan_check_inflight:
+            self._wan_recheck = True
+            return
+        interface_name = self._selected_interface()
+        
+        self._wan_check_inflight = True
+        future = self._submit_io(self._fetch_wan_ip, interface_name)
+        future.add_done_callback(lambda f: self.safe_gui_update(self._on_wan_ip_done, f))
+
+    def _submit_io(self, fn, *args):
+        """Run fn on the network pool, tracking the future until it finishes"""
+        future = self._io_pool.submit(fn, *args)
+        self._io_futures.add(future)
+        future.add_done_callback(self._io_futures.discard)
+        return future
+
+    def _fetch_wan_ip(self, interface_name):
+        """Worker: bind the validator to interface_name and return the external IP"""
+        self.controller.set_validation_interface(interface_name)
+        return self.controller.validator.get_external_ip()
+
+    def _on_wan_ip_done(self, future):
+        """Main thread: show the WAN IP check result"""
+        self._wan_check_inflight = False
+        if self._wan_recheck:
+            # The selection changed mid-check; this result is stale
+            self._wan_recheck = False
+            self.check_wan_ip()
+            return
+        try:
+            external_ip = future.result()
+        except Exception as e:
+            logger.error(f"Error checking WAN IP: {e}")
+            if self.wan_ip_value is not None:
+                self.wan_ip_value.config(text=f"Error: {e}", fg="red")
+            return
         
-        threading.Thread(target=check, daemon=True).start()
+        if self.wan_ip_value is not None:
+            self.wan_ip_value.config(
+                text=external_ip,
+                fg="red" if "failed" in external_ip.lower() else "green"
+            )
+        self.update_status(f"WAN IP: {external_ip}")
 
     def test_interface(self):
-        """Test the currently selected interface with enhanced error handling"""
+        """Test the currently selected interface on a worker thread"""
+        if self._interface_test_inflight or self.interface_var is None:
+            return
+        interface_name = self._selected_interface()
+        
+        self._interface_test_inflight = True
+        self.update_status(f"Testing interface {interface_name or 'Default'}...")
+        future = self._submit_io(self._probe_interface, interface_name)
+        future.add_done_callback(
+            lambda f: self.safe_gui_update(self._on_test_done, interface_name, f))
+
+    def _probe_interface(self, interface_name):
+        """Worker: fetch our external IP from httpbin.org through interface_name"""
+        self.controller.set_validation_interface(interface_name)
+        
+        # Quick test to httpbin.org to see our IP
+        session = self._get_probe_session(interface_name)
+        response = session.get('https://httpbin.org/ip', timeout=10)
+        return response.json().get('origin', 'Unknown')
+
+    def _get_probe_session(self, interface_name):
+        """Return the pooled probe session for interface_name, rebuilding it on change"""
+        if self._probe_session is not None and self._probe_session_iface == interface_name:
+            return self._probe_session
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._close_probe_session()
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        if interface_name:
+            session = self.controller.validator.interface_binder.bind_to_interface(session, interface_name)
+        self._probe_session = session
+        self._probe_session_iface = interface_name
+        return session
+
+    def _close_probe_session(self):
+        """Close the pooled probe session so the next test reconnects"""
+        if self._probe_session is not None:
+            self._probe_session.close()
+            self._probe_session = None
+
+    def _on_test_done(self, interface_name, future):
+        """Main thread: report the interface test result"""
+        self._interface_test_inflight = False
         try:
-            if hasattr(self, 'interface_var'):
-                interface_name = None
-                if self.interface_var.get() != "Auto (default)":
-                    interface_name = self.interface_var.get().split(' ')[0]
-                
-                self.controller.set_validation_interface(interface_name)
-                
-                # Quick test to httpbin.org to see our IP
-                import requests
-                with requests.Session() as session:
-                    if interface_name:
-                        session = self.controller.validator.interface_binder.bind_to_interface(session, interface_name)
-                        interface_info = f" via {interface_name}"
-                    else:
-                        interface_info = " (default)"
-                    
-                    response = session.get('https://httpbin.org/ip', timeout=10)
-                    ip_data = response.json()
-                    external_ip = ip_data.get('origin', 'Unknown')
-                    
-                    messagebox.showinfo("Interface Test", 
-                                      f"Interface: {interface_name or 'Default'}\n"
-                                      f"External IP: {external_ip}\n"
-                                      f"Status: ✅ Working")
-                    self.update_status(f"Interface test: {external_ip}{interface_info}")
-                    
-                    # Update WAN IP display
-                    def update_display():
-                        if hasattr(self, 'wan_ip_value') and self.wan_ip_value.winfo_exists():
-                            self.wan_ip_value.config(text=external_ip, fg="green")
-                    self.safe_gui_update(update_display)
+            external_ip = future.result()
         except Exception as e:
             messagebox.showerror("Interface Test Failed", f"Error: {e}")
             self.update_status("Interface test failed")
-            def show_error():
-                if hasattr(self, 'wan_ip_value') and self.wan_ip_value.winfo_exists():
-                    self.wan_ip_value.config(text=f"Test failed: {e}", fg="red")
-            self.safe_gui_update(show_error)
+            if self.wan_ip_value is not None:
+                self.wan_ip_value.config(text=f"Test failed: {e}", fg="red")
+            return
+        
+        interface_info = f" via {interface_name}" if interface_name else " (default)"
+        messagebox.showinfo("Interface Test", 
+                          f"Interface: {interface_name or 'Default'}\n"
+                          f"External IP: {external_ip}\n"
+                          f"Status: ✅ Working")
+        self.update_status(f"Interface test: {external_ip}{interface_info}")
+        
+        # Update WAN IP display
+        if self.wan_ip_value is not None:
+            self.wan_ip_value.config(text=external_ip, fg="green")
 
     def refresh_interfaces(self):
-        """Refresh network interfaces list with error handling"""
+        """Re-enumerate network interfaces on a worker and update the combobox"""
+        if self.interface_combo is not None:
+            self._submit_interface_scan(refresh=True, announce=True)
+
+    def _submit_interface_scan(self, refresh, announce):
+        """Enumerate interfaces off the Tk thread; the result lands in _on_interfaces_done"""
+        future = self._submit_io(self._fetch_interface_names, refresh)
+        future.add_done_callback(
+            lambda f: self.safe_gui_update(self._on_interfaces_done, f, announce))
+
+    def _fetch_interface_names(self, refresh):
+        """Worker: enumerate interfaces as (combobox string, interface name) pairs"""
+        interfaces = self.controller.get_network_interfaces(refresh=refresh)
+        return tuple((f"{i['name']} ({i['ip']}) - {i['type']}", i['name']) for i in interfaces)
+
+    def _on_interfaces_done(self, future, announce):
+        """Main thread: push the interface list to the combobox if it changed"""
         try:
-            if hasattr(self, 'interface_combo'):
-                interfaces = self.controller.get_network_interfaces()
-                interface_names = ["Auto (default)"] + [f"{i['name']} ({i['ip']}) - {i['type']}" for i in interfaces]
-                self.interface_combo['values'] = interface_names
-                self.update_status("Network interfaces refreshed")
+            choices = future.result()
         except Exception as e:
             logger.error(f"Error refreshing interfaces: {e}")
             self.update_status("Error refreshing interfaces")
+            return
+        
+        if choices != self._iface_cache_key:
+            self._iface_cache_key = choices
+            self._iface_display_to_name = {"Auto (default)": None, **dict(choices)}
+            self._iface_names = list(self._iface_display_to_name)
+            if self.interface_combo is not None:
+                self.interface_combo['values'] = self._iface_names
+        if announce:
+            self.update_status("Network interfaces refreshed")
 
     # ===== DATA MANAGEMENT METHODS =====
 
@@ -1143,8 +1241,7 @@ udp://tracker.opentrackr.org:1337/announce
 http://tracker.openbittorrent.com:80/announce
 udp://open.stealth.si:80/announce"""
         
-        self.input_text.delete('1.0', tk.END)
-        self.input_text.insert('1.0', sample_trackers)
+        self.input_text.replace('1.0', tk.END, sample_trackers)
         self.update_input_counter()
         self.update_status("Sample data loaded")
 
@@ -1162,17 +1259,15 @@ udp://open.stealth.si:80/announce"""
 
     def on_find_duplicates(self):
         try:
-            text = self.input_text.get('1.0', tk.END).strip()
-            if not text:
+            # One search instead of copying the whole input just to test for text
+            if not self.input_text.search(r'\S', '1.0', tk.END, regexp=True):
                 messagebox.showwarning("Warning", "Please enter some tracker URLs first!")
                 return
                 
             self.update_status("Finding duplicates...")
-            stats = self.controller.find_duplicates(text)
+            stats = self.controller.find_duplicates(self._iter_input_blocks())
             
-            self.unique_text.delete('1.0', tk.END)
-            unique_urls = self.controller.trackers.unique_urls
-            self.unique_text.insert('1.0', '\n'.join(unique_urls))
+            self._insert_lines(self.unique_text, self.controller.trackers.unique_urls)
             
             self.stats_label.config(
                 text=f"Total: {stats['total']} | Unique: {stats['unique']} | Duplicates: {stats['duplicates']}"
@@ -1181,7 +1276,7 @@ udp://open.stealth.si:80/announce"""
             # Update counters
             self.unique_counter.config(text=f"{stats['unique']} trackers")
             
-            self.notebook.select(1)  # Switch to validation tab
+            self._select_tab(VALIDATION_TAB)
             self.update_status(f"Found {stats['unique']} unique trackers out of {stats['total']} total")
             
             # Auto-start validation if few trackers
@@ -1197,8 +1292,24 @@ udp://open.stealth.si:80/announce"""
             messagebox.showerror("Error", f"An error occurred: {e}")
             self.update_status("Error finding duplicates")
     
+    def _iter_input_blocks(self):
+        """Yield the input text INSERT_CHUNK_LINES whole lines at a time"""
+        last_line = int(self.input_text.index('end-1c').split('.')[0])
+        for line in range(1, last_line + 1, INSERT_CHUNK_LINES):
+            yield self.input_text.get(f"{line}.0", f"{line + INSERT_CHUNK_LINES}.0")
+    
+    def _insert_lines(self, text_widget, lines):
+        """Replace text_widget's content with lines, joined and inserted INSERT_CHUNK_LINES at a time"""
+        text_widget.delete('1.0', tk.END)
+        last = len(lines) - 1
+        for start in range(0, len(lines), INSERT_CHUNK_LINES):
+            chunk = '\n'.join(lines[start:start + INSERT_CHUNK_LINES])
+            # No trailing newline after the final line, matching a single join
+            text_widget.insert(tk.END, chunk if start + INSERT_CHUNK_LINES > last else chunk + '\n')
+    
     def on_clear(self):
         """Clear current tab data"""
+        self._cancel_file_load()
         self.input_text.delete('1.0', tk.END)
         self.unique_text.delete('1.0', tk.END)
         self.stats_label.config(text="Total: 0 | Unique: 0 | Duplicates: 0")
@@ -1210,57 +1321,144 @@ udp://open.stealth.si:80/announce"""
     def on_clear_all(self):
         """Clear all data across tabs"""
         self.on_clear()
-        self.working_text.delete('1.0', tk.END)
-        self.dead_text.delete('1.0', tk.END)
-        self.preview_text.delete('1.0', tk.END)
-        self.progress['value'] = 0
-        self.progress_label.config(text="0/0")
-        self.timer_label.config(text="Elapsed: 0s")
-        self.working_label.config(text="Working Trackers: 0")
-        self.dead_label.config(text="Dead Trackers: 0")
-        self.validation_stats.config(text="Working: 0 | Dead: 0")
-        self.preview_info.config(text="No data to preview")
+        self._reset_validation_results()
+        # Tabs that were never shown have nothing to clear
+        if self._tab_built[VALIDATION_TAB]:
+            self.timer_label.config(text="Elapsed: 0s")
+        if self._tab_built[RESULTS_TAB]:
+            self.preview_window.reset()
+            self.preview_window.set_rows([])
+            self.preview_info.config(text="No data to preview")
         self.update_status("All data cleared")
     
+    def _reset_validation_results(self, keep_rows=False):
+        """Reset counters and progress; the result areas are cleared unless keep_rows (delta re-run)"""
+        if keep_rows:
+            self._flush_now()  # buffered lines belong to the rows being kept
+        else:
+            self._working_buffer.clear()
+            self._dead_buffer.clear()
+            self._row_replacements.clear()
+            self._row_removals.clear()
+        had_rows = bool(self._row_lines) and not keep_rows
+        if had_rows:
+            self._working_rows, self._dead_rows = [], []
+            self._row_lines.clear()
+            self._row_pos.clear()
+        self._run_seen.clear()
+        self._working_count = self._dead_count = 0
+        if not self._tab_built[VALIDATION_TAB]:
+            return
+        self.progress.configure(value=0)
+        self.progress_label.config(text="0/0")
+        # Without shown rows or counts the result areas and counter labels are already blank
+        if had_rows:
+            for text_widget in (self.working_text, self.dead_text):
+                text_widget.config(state='normal')
+                text_widget.delete('1.0', tk.END)
+                text_widget.config(state='disabled')
+        if self._shown_counts != (0, 0):
+            self._shown_counts = (0, 0)
+            self.working_label.config(text="Working Trackers: 0")
+            self.dead_label.config(text="Dead Trackers: 0")
+            self.validation_stats.config(text="Working: 0 | Dead: 0")
+    
+    def _can_reuse_rows(self, urls):
+        """True when most shown rows belong to urls, so a delta update beats a full redraw"""
+        if not self._row_lines:
+            return False
+        wanted = set(urls)
+        return sum(url in wanted for url in self._row_lines) * 2 >= len(self._row_lines)
+    
     def on_load_file(self):
         file_path = filedialog.askopenfilename(
             title="Load Tracker List",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.input_text.delete('1.0', tk.END)
-                self.input_text.insert('1.0', content)
-                self.update_input_counter()
-                self.update_status(f"Loaded trackers from {file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not load file: {e}")
-                self.update_status("Error loading file")
+            self._cancel_file_load()
+            self._load_token = token = object()
+            self._load_path = file_path
+            self.input_text.delete('1.0', tk.END)
+            self.update_status(f"Loading trackers from {file_path}...")
+            self._submit_load_chunk(token)
+    
+    def _submit_load_chunk(self, token):
+        """Read the next chunk of the file being loaded on the file worker"""
+        future = self._file_pool.submit(self._read_load_chunk, self._load_path)
+        future.add_done_callback(lambda f: self.safe_gui_update(self._on_load_chunk, token, f))
+    
+    def _read_load_chunk(self, file_path):
+        """Worker: return the next chunk of file_path, opening it on the first call; '' at EOF"""
+        if self._load_file is None:
+            self._load_file = open(file_path, 'r', encoding='utf-8', buffering=LOAD_BUFFER_SIZE)
+        chunk = self._load_file.read(LOAD_CHUNK_CHARS)
+        if not chunk:
+            self._close_load_file()
+        return chunk
+    
+    def _close_load_file(self):
+        """Worker: close the file being loaded, if any"""
+        if self._load_file is not None:
+            self._load_file.close()
+            self._load_file = None
+    
+    def _on_load_chunk(self, token, future):
+        """Main thread: insert a loaded chunk and request the next one until EOF"""
+        if token is not self._load_token:
+            return  # load was cancelled or superseded
+        try:
+            chunk = future.result()
+        except Exception as e:
+            self._cancel_file_load()
+            messagebox.showerror("Error", f"Could not load file: {e}")
+            self.update_status("Error loading file")
+            return
+        
+        if chunk:
+            self.input_text.insert(tk.END, chunk)
+            self._submit_load_chunk(token)
+            return
+        
+        file_path = self._load_path
+        self._load_token = self._load_path = None
+        self.update_input_counter()
+        self.update_status(f"Loaded trackers from {file_path}")
+    
+    def _cancel_file_load(self):
+        """Stop an in-progress chunked load; the worker closes its file after any pending read"""
+        if self._load_token is None:
+            return
+        self._load_token = self._load_path = None
+        self._file_pool.submit(self._close_load_file)
     
     def on_start_validation(self):
         try:
             if not self.controller.trackers.unique_urls:
                 messagebox.showwarning("Warning", "No trackers to validate! Find duplicates first.")
                 return
+            self._ensure_tab_built(VALIDATION_TAB)
+            # Only interfaces from the last scan are accepted (a refresh may have dropped the selection)
+            if self.interface_var is not None and self.interface_var.get() not in self._iface_display_to_name:
+                raise ValueError("The selected network interface is no longer available. "
+                                 "Choose another interface or Auto.")
                 
-            # Reset UI state
-            self.working_text.delete('1.0', tk.END)
-            self.dead_text.delete('1.0', tk.END)
-            self.working_label.config(text="Working Trackers: 0")
-            self.dead_label.config(text="Dead Trackers: 0")
-            self.validation_stats.config(text="Working: 0 | Dead: 0")
-            self.progress['value'] = 0
+            # Reset UI state; a re-run over mostly the same trackers keeps the shown rows
+            self._reset_validation_results(
+                keep_rows=self._can_reuse_rows(self.controller.trackers.unique_urls))
+            self._last_progress_ts, self._last_pct_logged = 0.0, -1
             
             # Set network interface before validation (Linux only)
-            if hasattr(self, 'interface_var') and self.interface_var.get() != "Auto (default)":
-                interface_name = self.interface_var.get().split(' ')[0]
+            interface_name = self._selected_interface()
+            if interface_name:
                 self.controller.set_validation_interface(interface_name)
                 self.update_status(f"Validation using interface: {interface_name}")
             else:
                 self.controller.set_validation_interface(None)
                 self.update_status("Validation using default interface")
+            # Interface suffix for every result line of this run
+            bound_interface = self.controller.validator.bound_interface
+            self._interface_suffix = f" [via {bound_interface}]" if bound_interface else ""
                 
             self.controller.start_validation()
             self.validate_btn.config(state='disabled')
@@ -1282,6 +1480,7 @@ udp://open.stealth.si:80/announce"""
         """Stop validation and clean up"""
         try:
             self.controller.stop_validation()
+            self._drop_unseen_rows()
             self.validate_btn.config(state='normal')
             self.stop_btn.config(state='disabled')
             self.stop_timer()
@@ -1292,6 +1491,7 @@ udp://open.stealth.si:80/announce"""
     def on_validation_complete(self, working_count: int, total_count: int, elapsed: float):
         """Called when validation completes"""
         try:
+            self._drop_unseen_rows()
             self.validate_btn.config(state='normal')
             self.stop_btn.config(state='disabled')
             self.stop_timer()
@@ -1305,50 +1505,69 @@ udp://open.stealth.si:80/announce"""
             message = f"Validation finished! Working: {working_count}/{total_count} ({success_rate:.1f}%) - Time: {elapsed:.2f}s"
             
             self.update_status(message)
-            self.update_preview()
-            self.notebook.select(2)  # Switch to results tab
+            self._select_tab(RESULTS_TAB)
             
-            # Show completion message
-            self.root.after(100, lambda: messagebox.showinfo("Complete", message))
+            # Completion notice once the preview is in, without blocking the event loop
+            self.update_preview(on_ready=lambda: self._show_notice("Complete", message))
             
         except Exception as e:
             logger.error(f"Error in validation completion: {e}")
 
     # ===== EXPORT AND COPY METHODS =====
 
-    def update_preview(self):
-        """Update results preview based on selected format"""
+    def update_preview(self, on_ready=None):
+        """Rebuild the results preview on the file worker; on_ready runs once it is shown"""
+        self._ensure_tab_built(RESULTS_TAB)
+        format_type = self.export_format.get()
+        self._preview_token = token = object()
+        self.preview_info.config(text="Generating preview...")
+        future = self._file_pool.submit(self._build_preview, format_type)
+        future.add_done_callback(
+            lambda f: self.safe_gui_update(self._on_preview_ready, token, f, on_ready))
+    
+    def _build_preview(self, format_type):
+        """Worker: return (lines, format label) for the preview of format_type"""
+        if format_type == "txt":
+            return self.controller.trackers.working_urls, "Text format (TXT)"
+        elif format_type == "json":
+            import json
+            data = self.controller.export_all_results()
+            return json.dumps(data, indent=2, ensure_ascii=False).splitlines(), "JSON format"
+        elif format_type == "csv":
+            return self.controller.export_csv().splitlines(), "CSV format"
+        return ["Unsupported format"], "Unsupported format"
+    
+    def _on_preview_ready(self, token, future, on_ready):
+        """Main thread: show a finished preview unless a newer one was requested"""
+        if token is not self._preview_token:
+            return
+        # New content starts at the top; index-keyed selections refer to the old lines
+        self.preview_window.reset()
         try:
-            format_type = self.export_format.get()
-            
-            if format_type == "txt":
-                content = self.controller.export_working_trackers()
-                self.preview_info.config(text="Text format (TXT)")
-            elif format_type == "json":
-                import json
-                data = self.controller.export_all_results()
-                content = json.dumps(data, indent=2, ensure_ascii=False)
-                self.preview_info.config(text="JSON format")
-            elif format_type == "csv":
-                content = self.controller.export_csv()
-                self.preview_info.config(text="CSV format")
-            else:
-                content = "Unsupported format"
-                self.preview_info.config(text="Unsupported format")
-            
-            self.preview_text.delete('1.0', tk.END)
-            if content.strip():
-                self.preview_text.insert('1.0', content)
-                line_count = len(content.splitlines())
-                self.preview_info.config(text=f"{self.preview_info.cget('text')} - {line_count} lines")
+            lines, format_label = future.result()
+            if lines:
+                self.preview_window.set_rows(lines)
+                self.preview_info.config(text=f"{format_label} - {len(lines)} lines")
             else:
-                self.preview_text.insert('1.0', "No data available for preview")
+                self.preview_window.set_rows(["No data available for preview"])
                 self.preview_info.config(text="No data to preview")
                 
         except Exception as e:
             logger.error(f"Error updating preview: {e}")
-            self.preview_text.delete('1.0', tk.END)
-            self.preview_text.insert('1.0', f"Error generating preview: {e}")
+            self.preview_window.set_rows([f"Error generating preview: {e}"])
+        if on_ready is not None:
+            on_ready()
+    
+    def _render_preview_rows(self, lines):
+        """Show lines in the preview tree, reusing the existing row items"""
+        tree = self.preview_tree
+        items = tree.get_children()
+        for item, line in zip(items, lines):
+            tree.item(item, values=(line,))
+        if len(items) > len(lines):
+            tree.delete(*items[len(lines):])
+        for line in lines[len(items):]:
+            tree.insert('', 'end', values=(line,))
     
     def on_export_file(self):
         """Export results based on selected format"""
@@ -1360,9 +1579,8 @@ udp://open.stealth.si:80/announce"""
                 file_types = [("Text files", "*.txt"), ("All files", "*.*")]
                 defaultextension = ".txt"
             elif format_type == "json":
-                import json
-                data = self.controller.export_all_results()
-                content = json.dumps(data, indent=2, ensure_ascii=False)
+                # Streamed record by record into the file below
+                content = None
                 file_types = [("JSON files", "*.json"), ("All files", "*.*")]
                 defaultextension = ".json"
             elif format_type == "csv":
@@ -1373,7 +1591,7 @@ udp://open.stealth.si:80/announce"""
                 messagebox.showerror("Error", "Unsupported export format")
                 return
             
-            if not content.strip():
+            if content is not None and not content.strip():
                 messagebox.showwarning("Warning", "No data to export!")
                 return
                 
@@ -1383,17 +1601,42 @@ udp://open.stealth.si:80/announce"""
                 title=f"Export Results as {format_type.upper()}"
             )
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                trackers_count = len(content.splitlines())
-                messagebox.showinfo("Success", f"Exported {trackers_count} items to {file_path}")
-                self.update_status(f"Exported {trackers_count} items to {format_type.upper()}")
+                trackers_count = self._export_item_count(format_type)
+                self.update_status(f"Exporting {trackers_count} items to {format_type.upper()}...")
+                future = self._file_pool.submit(self._write_export, file_path, content)
+                future.add_done_callback(lambda f: self.safe_gui_update(
+                    self._on_export_done, f, file_path, format_type, trackers_count))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {e}")
             self.update_status("Export failed")
     
+    def _write_export(self, file_path, content):
+        """Worker: write content to file_path, or stream the JSON export when content is None"""
+        with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            if content is None:
+                self.controller.write_results_json(f)
+            else:
+                for start in range(0, len(content), EXPORT_CHUNK_CHARS):
+                    f.write(content[start:start + EXPORT_CHUNK_CHARS])
+    
+    def _on_export_done(self, future, file_path, format_type, trackers_count):
+        """Main thread: report the export result"""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Export failed: {e}")
+            self.update_status("Export failed")
+            return
+        messagebox.showinfo("Success", f"Exported {trackers_count} items to {file_path}")
+        self.update_status(f"Exported {trackers_count} items to {format_type.upper()}")
+    
+    def _export_item_count(self, format_type):
+        """Items in an export of format_type, asked from the controller instead of counting lines"""
+        if format_type == "txt":
+            return self.controller.working_tracker_count
+        return self.controller.result_count
+    
     def on_copy_clipboard(self):
         try:
             format_type = self.export_format.get()
@@ -1413,10 +1656,9 @@ udp://open.stealth.si:80/announce"""
                 messagebox.showwarning("Warning", "No data to copy!")
                 return
                 
-            self.root.clipboard_clear()
-            self.root.clipboard_append(content)
+            self._set_clipboard(content)
             
-            items_count = len(content.splitlines())
+            items_count = self._export_item_count(format_type)
             messagebox.showinfo("Success", f"Copied {items_count} items to clipboard!")
             self.update_status(f"Copied {items_count} items to clipboard")
             
@@ -1424,10 +1666,21 @@ udp://open.stealth.si:80/announce"""
             messagebox.showerror("Error", f"Copy failed: {e}")
             self.update_status("Copy to clipboard failed")
 
+    def _set_clipboard(self, content):
+        """Replace the clipboard with content in one call"""
+        if PYPERCLIP_AVAILABLE and len(content) >= CLIPBOARD_DIRECT_MIN_CHARS:
+            try:
+                pyperclip.copy(content)
+                return
+            except pyperclip.PyperclipException as e:
+                logger.debug(f"pyperclip copy failed, using Tk clipboard: {e}")
+        self.root.clipboard_clear()
+        self.root.clipboard_append(content, type='STRING')
+    
     def copy_as_table(self):
         """Copy working trackers as tab-separated table for spreadsheets"""
         try:
-            working_trackers = [tracker.url for tracker in self.controller.trackers.working_trackers]
+            working_trackers = self.controller.trackers.working_urls
             if not working_trackers:
                 messagebox.showwarning("Warning", "No working trackers to copy!")
                 return
@@ -1435,8 +1688,7 @@ udp://open.stealth.si:80/announce"""
             # Create tab-separated table
             table_content = '\t'.join(working_trackers)
             
-            self.root.clipboard_clear()
-            self.root.clipboard_append(table_content)
+            self._set_clipboard(table_content)
             
             messagebox.showinfo("Success", f"Copied {len(working_trackers)} trackers as table to clipboard!\n\nPaste into Excel/Google Sheets as tab-separated data.")
             self.update_status(f"Copied {len(working_trackers)} trackers as table")
@@ -1447,6 +1699,23 @@ udp://open.stealth.si:80/announce"""
 
     # ===== UTILITY AND HELPER METHODS =====
 
+    def _show_notice(self, title: str, message: str):
+        """Show a non-modal notice window, replacing any previous one"""
+        if self._notice is not None and self._notice.winfo_exists():
+            self._notice.destroy()
+        bg, fg = self._palette[:2] if self._palette else (None, None)
+        self._notice = notice = tk.Toplevel(self.root, bg=bg)
+        notice.title(title)
+        notice.transient(self.root)
+        notice.resizable(False, False)
+        tk.Label(notice, text=message, bg=bg, fg=fg, justify='left',
+                 wraplength=420).pack(padx=20, pady=(15, 10))
+        ok_btn = ttk.Button(notice, text="OK", command=notice.destroy)
+        ok_btn.pack(pady=(0, 15))
+        ok_btn.focus_set()
+        notice.bind('<Return>', lambda e: notice.destroy())
+        notice.bind('<Escape>', lambda e: notice.destroy())
+    
     def show_error(self, message: str):
         """Show error message - used by controller"""
         messagebox.showerror("Error", message)
@@ -1493,6 +1762,7 @@ udp://open.stealth.si:80/announce"""
     def start_timer(self):
         """Start the elapsed time timer"""
         self._timer_running = True
+        self._last_elapsed_sec = -1
         self._update_timer()
     
     def stop_timer(self):
@@ -1508,17 +1778,23 @@ udp://open.stealth.si:80/announce"""
             return
         
         try:
+            delay = 1000
             if hasattr(self, 'start_time'):
-                elapsed = int(time.time() - self.start_time)
-                minutes = elapsed // 60
-                seconds = elapsed % 60
-                if minutes > 0:
-                    self.timer_label.config(text=f"Elapsed: {minutes}m {seconds}s")
-                else:
-                    self.timer_label.config(text=f"Elapsed: {seconds}s")
+                elapsed_f = time.time() - self.start_time
+                elapsed = int(elapsed_f)
+                # Only touch the label when the displayed second changes
+                if elapsed != self._last_elapsed_sec:
+                    self._last_elapsed_sec = elapsed
+                    minutes, seconds = divmod(elapsed, 60)
+                    if minutes > 0:
+                        self.timer_label.config(text=f"Elapsed: {minutes}m {seconds}s")
+                    else:
+                        self.timer_label.config(text=f"Elapsed: {seconds}s")
+                # Aim just past the next whole second so late ticks don't accumulate drift
+                delay = 1010 - int((elapsed_f - elapsed) * 1000)
             
             # Schedule next update
-            self._timer_id = self.root.after(1000, self._update_timer)
+            self._timer_id = self.root.after(delay, self._update_timer)
         except Exception as e:
             logger.debug(f"Timer update error: {e}")
             self._timer_running = False
@@ -1526,66 +1802,153 @@ udp://open.stealth.si:80/announce"""
     # ===== PROGRESS AND UPDATE METHODS =====
 
     def update_progress(self, percent, current, total):
-        """Update progress bar and label with bounds checking"""
-        self.safe_gui_update(lambda: self._update_progress_internal(percent, current, total))
+        """Queue a progress update for the next flush, at most every PROGRESS_MIN_INTERVAL"""
+        now = time.monotonic()
+        if percent < 100 and now - self._last_progress_ts < PROGRESS_MIN_INTERVAL:
+            return
+        self._last_progress_ts = now
+        self._pending_progress = (percent, current, total)
+        self._schedule_flush()
     
     def _update_progress_internal(self, percent, current, total):
-        """Internal progress update (called from safe_gui_update)"""
+        """Internal progress update (called from _flush_buffers)"""
         try:
-            if hasattr(self, 'progress') and self.progress.winfo_exists():
-                safe_percent = max(0, min(100, percent))
+            safe_percent = max(0, min(100, percent))
+            if self.progress is not None:
                 self.progress['value'] = safe_percent
                 
-            if hasattr(self, 'progress_label') and self.progress_label.winfo_exists():
+            if self.progress_label is not None:
                 self.progress_label.config(text=f"{current}/{total}")
-                
-            self.update_status(f"Validating... {current}/{total} ({safe_percent:.1f}%)")
+            
+            # Status bar and log line only when the whole percent moves
+            if int(safe_percent) != self._last_pct_logged:
+                self._last_pct_logged = int(safe_percent)
+                self.update_status(f"Validating... {current}/{total} ({safe_percent:.1f}%)")
         except Exception as e:
             logger.debug(f"Progress update failed: {e}")
 
     def append_tracker_result(self, tracker):
-        """Append a single tracker result to the appropriate text area"""
-        self.safe_gui_update(lambda: self._append_tracker_result_internal(tracker))
+        """Format a tracker result and queue it unless the same line is already shown"""
+        url, alive, response_time = tracker.url, tracker.alive, tracker.response_time
+        if alive:
+            self._working_count += 1
+            if response_time:
+                line = _LINE_OK_TIMED % (url, response_time, self._interface_suffix)
+            else:
+                line = _LINE_OK % (url, self._interface_suffix)
+        else:
+            self._dead_count += 1
+            if response_time:
+                line = _LINE_BAD_TIMED % (url, response_time, self._interface_suffix)
+            else:
+                line = _LINE_BAD % (url, self._interface_suffix)
+        self._run_seen.add(url)
+        
+        shown = self._row_lines.get(url)
+        if shown is None or shown[0] != alive:
+            # New row, or it moved between the working and dead areas
+            if shown is not None:
+                self._row_removals.append((shown[0], self._row_pos[url]))
+            rows = self._working_rows if alive else self._dead_rows
+            self._row_pos[url] = len(rows)
+            rows.append(url)
+            (self._working_buffer if alive else self._dead_buffer).append(line)
+            self._row_lines[url] = (alive, line)
+        elif shown[1] != line:
+            self._row_replacements.append(url)
+            self._row_lines[url] = (alive, line)
+        self._schedule_flush()
+    
+    def _drop_unseen_rows(self):
+        """Remove rows the current run produced no result for, then flush everything"""
+        if len(self._run_seen) < len(self._row_lines):
+            for url in [url for url in self._row_lines if url not in self._run_seen]:
+                alive, _ = self._row_lines.pop(url)
+                self._row_removals.append((alive, self._row_pos.pop(url)))
+            self._schedule_flush()
+        self._flush_now()
+    
+    def _schedule_flush(self):
+        """Schedule one _flush_buffers RESULT_FLUSH_MS from now unless one is pending"""
+        if self._flush_after_id is None:
+            self._flush_after_id = self.root.after(RESULT_FLUSH_MS, self._flush_buffers)
     
-    def _append_tracker_result_internal(self, tracker):
-        """Internal tracker result append (called from safe_gui_update)"""
+    def _flush_now(self):
+        """Flush buffered results immediately (validation finished or stopped)"""
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+            self._flush_buffers(force_scroll=True)
+    
+    def _remove_rows(self, removals):
+        """Delete (alive, pos) lines bottom-up and renumber the rows left in each area"""
+        for alive, text_widget in ((True, self.working_text), (False, self.dead_text)):
+            gone = sorted((pos for flag, pos in removals if flag == alive), reverse=True)
+            if not gone:
+                continue
+            for pos in gone:
+                text_widget.delete(f"{pos + 1}.0", f"{pos + 2}.0")
+            gone = set(gone)
+            rows = [url for i, url in enumerate(self._working_rows if alive else self._dead_rows)
+                    if i not in gone]
+            if alive:
+                self._working_rows = rows
+            else:
+                self._dead_rows = rows
+            row_pos = self._row_pos
+            for i, url in enumerate(rows):
+                row_pos[url] = i
+    
+    def _flush_buffers(self, force_scroll=False):
+        """Insert each buffered result area with one insert call and update the counters"""
+        self._flush_after_id = None
+        working_lines, dead_lines = self._working_buffer, self._dead_buffer
+        self._working_buffer, self._dead_buffer = [], []
+        if self.working_text is None:
+            self._pending_progress = None
+            return
+        replacements, self._row_replacements = self._row_replacements, []
+        removals, self._row_removals = self._row_removals, []
+        
+        # Only auto-scroll if enabled, and at most every SCROLL_MIN_INTERVAL
+        scroll = False
+        if self.auto_scroll:
+            now = time.monotonic()
+            if force_scroll or now - self._last_see >= SCROLL_MIN_INTERVAL:
+                self._last_see = now
+                scroll = True
+        
+        # The areas are read-only so user edits never shift the cached row positions
+        self.working_text.config(state='normal')
+        self.dead_text.config(state='normal')
         try:
-            text_widget = self.working_text if tracker.alive else self.dead_text
-            counter_label = self.working_label if tracker.alive else self.dead_label
-            
-            # Enhanced safety checks
-            if not (text_widget and text_widget.winfo_exists()):
-                return
-            if not (counter_label and counter_label.winfo_exists()):
-                return
-            
-            status_icon = "✅" if tracker.alive else "❌"
-            response_time = f" ({tracker.response_time:.2f}s)" if tracker.response_time else ""
+            # Changed lines are rewritten where they stand, before removals shift line numbers
+            for url in replacements:
+                alive, line = self._row_lines[url]
+                text_widget = self.working_text if alive else self.dead_text
+                start = f"{self._row_pos[url] + 1}.0"
+                text_widget.replace(start, f"{start} lineend", line[:-1])
+            if removals:
+                self._remove_rows(removals)
+            
+            for text_widget, lines in ((self.working_text, working_lines), (self.dead_text, dead_lines)):
+                if lines:
+                    text_widget.insert(tk.END, ''.join(lines))
+                    if scroll:
+                        text_widget.see(tk.END)
             
-            # Add interface info if bound
-            interface_info = ""
-            if hasattr(self.controller.validator, 'bound_interface') and self.controller.validator.bound_interface:
-                interface_info = f" [via {self.controller.validator.bound_interface}]"
-            
-            text_widget.insert(tk.END, f"{status_icon} {tracker.url}{response_time}{interface_info}\n")
-            
-            # Update counter
-            current_text = counter_label.cget("text")
-            count = int(current_text.split(": ")[1]) + 1
-            counter_label.config(text=f"{current_text.split(':')[0]}: {count}")
-            
-            # Update validation stats
-            if (hasattr(self, 'working_label') and self.working_label.winfo_exists() and
-                hasattr(self, 'dead_label') and self.dead_label.winfo_exists() and
-                hasattr(self, 'validation_stats') and self.validation_stats.winfo_exists()):
-                
-                working_count = int(self.working_label.cget("text").split(": ")[1])
-                dead_count = int(self.dead_label.cget("text").split(": ")[1])
-                self.validation_stats.config(text=f"Working: {working_count} | Dead: {dead_count}")
-            
-            # Only auto-scroll if enabled
-            if self.auto_scroll:
-                text_widget.see(tk.END)
-                
-        except Exception as e:
-            logger.debug(f"Could not append tracker result: {e}")
\ No newline at end of file
+            # Update counters
+            if (self._working_count, self._dead_count) != self._shown_counts:
+                self._shown_counts = (self._working_count, self._dead_count)
+                self.working_label.config(text=f"Working Trackers: {self._working_count}")
+                self.dead_label.config(text=f"Dead Trackers: {self._dead_count}")
+                self.validation_stats.config(text=f"Working: {self._working_count} | Dead: {self._dead_count}")
+        except tk.TclError as e:
+            logger.debug(f"Could not append tracker results: {e}")
+        finally:
+            self.working_text.config(state='disabled')
+            self.dead_text.config(state='disabled')
+        
+        # Progress shares this flush with the results
+        if self._pending_progress is not None:
+            progress, self._pending_progress = self._pending_progress, None
+            self._update_progress_internal(*progress)
@@ -0,0 +1,162 @@
+import tkinter as tk
+from tkinter import ttk
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows rendered past the estimated viewport so partial/misestimated rows never show blank
+BUFFER_ROWS = 5
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 25
+
+class VirtualTreeWindow:
+    """Keeps only the visible slice of a large row list inside a ttk.Treeview"""
+
+    def __init__(self, tree, v_scrollbar, render, key=None):
+        self.tree = tree
+        self.v_scrollbar = v_scrollbar
+        self.render = render  # called with the list of rows for the current window
+        self.key = key  # row -> stable selection key; absolute row index when None
+        self.rows = []
+        self.offset = 0
+        self.visible = max(1, int(tree.cget('height')))
+        # Selection and keyboard cursor live here since rows leave the tree on scroll
+        self.selected = set()
+        self.cursor = -1  # first <Down> lands on row 0
+
+        # The scrollbar now drives our offset instead of the tree's own yview
+        v_scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand='')
+        tree.bind('<Configure>', self._on_configure, add='+')
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', lambda e: self._scroll_by(-3))
+        tree.bind('<Button-5>', lambda e: self._scroll_by(3))
+        tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        tree.bind('<Up>', lambda e: self._move_cursor(self.cursor - 1))
+        tree.bind('<Down>', lambda e: self._move_cursor(self.cursor + 1))
+        tree.bind('<Prior>', lambda e: self._move_cursor(self.cursor - self.visible))
+        tree.bind('<Next>', lambda e: self._move_cursor(self.cursor + self.visible))
+        tree.bind('<Home>', lambda e: self._move_cursor(0))
+        tree.bind('<End>', lambda e: self._move_cursor(len(self.rows) - 1))
+
+    # ===== DATA METHODS =====
+
+    def set_rows(self, rows):
+        """Replace the full row list and redraw the current window"""
+        self.rows = rows
+        self._draw()
+
+    def reset(self):
+        """Forget scroll position, cursor and selection before showing unrelated rows"""
+        self.offset = 0
+        self.cursor = -1
+        self.selected.clear()
+
+    def see(self, index):
+        """Scroll so the row at index is inside the viewport"""
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible:
+            self.offset = index - self.visible + 1
+        self._draw()
+
+    def _row_key(self, index):
+        return self.key(self.rows[index]) if self.key else index
+
+    # ===== SELECTION METHODS =====
+
+    def _on_select(self, event=None):
+        """Fold the tree's selection of the rendered rows into the key set"""
+        tree = self.tree
+        children = tree.get_children()
+        end = min(len(children), len(self.rows) - self.offset)
+        positions = {item: i for i, item in enumerate(children[:end])}
+        for i in range(end):
+            self.selected.discard(self._row_key(self.offset + i))
+        for item in tree.selection():
+            if item in positions:
+                self.selected.add(self._row_key(self.offset + positions[item]))
+        focus = tree.focus()
+        if focus in positions:
+            self.cursor = self.offset + positions[focus]
+        # A click on a buffered row past the viewport makes Tk scroll internally;
+        # move the offset instead so the window stays aligned with the scrollbar
+        first = tree.yview()[0]
+        if first > 0 and children:
+            self.offset += round(first * len(children))
+            self._draw()
+
+    def _move_cursor(self, index):
+        """Keyboard navigation: move the cursor row, scrolling the window to keep it shown"""
+        if not self.rows:
+            return "break"
+        index = max(0, min(index, len(self.rows) - 1))
+        self.cursor = index
+        self.selected = {self._row_key(index)}
+        self.see(index)
+        children = self.tree.get_children()
+        position = index - self.offset
+        if 0 <= position < len(children):
+            self.tree.focus(children[position])
+        # Re-selecting during the redraw read the old focus item back into the cursor
+        self.cursor = index
+        return "break"
+
+    # ===== SCROLLING METHODS =====
+
+    def yview(self, *args):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.offset = int(float(args[1]) * len(self.rows))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self.offset += step * self.visible if args[2] == 'pages' else step
+        self._draw()
+
+    def _scroll_by(self, rows):
+        self.offset += rows
+        self._draw()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        step = -(event.delta // 120) if abs(event.delta) >= 120 else (-1 if event.delta > 0 else 1)
+        return self._scroll_by(step * 3)
+
+    def _on_configure(self, event=None):
+        """Resize the window to the rows that fit the tree's current height"""
+        try:
+            row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+        except (ValueError, tk.TclError):
+            row_height = DEFAULT_ROW_HEIGHT
+        visible = max(1, (self.tree.winfo_height() - HEADING_HEIGHT) // row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self._draw()
+
+    # ===== RENDERING METHODS =====
+
+    def _draw(self):
+        """Render the window at the clamped offset and sync the scrollbar"""
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self.visible))
+        self.render(self.rows[self.offset:self.offset + self.visible + BUFFER_ROWS])
+        self._apply_selection()
+        if total:
+            self.v_scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible) / total))
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+
+    def _apply_selection(self):
+        """Re-select the rendered rows whose keys are selected and pin the tree's yview"""
+        tree = self.tree
+        tree.yview_moveto(0)
+        children = tree.get_children()
+        end = min(len(children), len(self.rows) - self.offset)
+        wanted = tuple(children[i] for i in range(end)
+                       if self._row_key(self.offset + i) in self.selected)
+        if set(wanted) != set(tree.selection()):
+            # Fires <<TreeviewSelect>>, which only re-adds these same keys
+            tree.selection_set(wanted)